@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 
 class BandHandling(str, Enum):
@@ -11,7 +12,12 @@ class BandHandling(str, Enum):
 
     @classmethod
     def labels(cls) -> list[str]:
-        return [member.value for member in cls]
+        return list(cls._label_tuple())
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _label_tuple(cls) -> tuple[str, ...]:
+        return tuple(member.value for member in cls)
 
     @classmethod
     def from_label(cls, label: str) -> "BandHandling":
@@ -9,6 +9,8 @@ import subprocess
 from app.recommendation import HardwareProfile
 from scripts.hardware_targets import get_hardware_targets
 
+_NVIDIA_SMI_TIMEOUT_S = 2.0
+
 
 def detect_hardware_profile() -> HardwareProfile:
     targets = get_hardware_targets()
@@ -37,8 +39,10 @@ def _gpu_detected() -> bool:
             capture_output=True,
             text=True,
             check=False,
+            timeout=_NVIDIA_SMI_TIMEOUT_S,
+            stdin=subprocess.DEVNULL,
         )
-    except OSError:
+    except (OSError, subprocess.TimeoutExpired):
         return False
     if result.returncode != 0:
         return False
@@ -54,8 +58,10 @@ def _detect_vram_gb() -> int:
             capture_output=True,
             text=True,
             check=False,
+            timeout=_NVIDIA_SMI_TIMEOUT_S,
+            stdin=subprocess.DEVNULL,
         )
-    except OSError:
+    except (OSError, subprocess.TimeoutExpired):
         return 0
     if result.returncode != 0:
         return 0
@@ -11,6 +11,8 @@ from typing import Callable
 from app.error_handling import UserFacingError
 from app.model_wrapper import ModelWrapper
 
+_NVIDIA_SMI_TIMEOUT_S = 2.0
+
 
 @dataclass(frozen=True)
 class InferenceRequest:
@@ -167,8 +169,10 @@ def _gpu_available(env: Mapping[str, str]) -> bool:
             text=True,
             check=False,
             env=dict(env),
+            timeout=_NVIDIA_SMI_TIMEOUT_S,
+            stdin=subprocess.DEVNULL,
         )
-    except OSError:
+    except (OSError, subprocess.TimeoutExpired):
         return False
     if result.returncode != 0:
         return False
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+from app.model_installation import resolve_model_cache_dir
+
+
+PREVIEW_CACHE_ENV = "SAT_UPSCALE_PREVIEW_CACHE_DIR"
+DEFAULT_SUBDIR = "preview-thumbnails"
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+class PreviewCache:
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self._cache_dir = cache_dir or resolve_preview_cache_dir()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir
+
+    def thumbnail_path(self, source: str | Path) -> Path | None:
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return None
+        key = f"{os.path.abspath(source)}|{stat.st_mtime_ns}|{stat.st_size}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self._cache_dir / f"{digest}.png"
+
+    def touch(self, path: Path) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            return
+
+    def prune(self) -> None:
+        entries: list[tuple[int, int, str]] = []
+        try:
+            with os.scandir(self._cache_dir) as scan:
+                for entry in scan:
+                    if entry.name.startswith(".") or not entry.name.endswith(".png"):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        except OSError:
+            return
+        entries.sort(reverse=True)
+        kept = 0
+        kept_bytes = 0
+        for _, size, path in entries:
+            if kept < self._max_entries and kept_bytes + size <= self._max_bytes:
+                kept += 1
+                kept_bytes += size
+                continue
+            kept = self._max_entries
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+
+
+def resolve_preview_cache_dir(model_cache_dir: Path | None = None) -> Path:
+    env_path = os.getenv(PREVIEW_CACHE_ENV)
+    if env_path:
+        return Path(env_path).expanduser()
+    return resolve_model_cache_dir(cache_dir=model_cache_dir) / DEFAULT_SUBDIR
@@ -62,12 +62,15 @@ def _safe_bool(value: object) -> bool:
 class SessionStore:
     def __init__(self, path: Path | None = None) -> None:
         self._path = path or _default_session_path()
+        self._pending: SessionState | None = None
 
     @property
     def path(self) -> Path:
         return self._path
 
     def load(self) -> SessionState:
+        if self._pending is not None:
+            return self._pending
         if not self._path.exists():
             return SessionState()
         try:
@@ -95,7 +98,16 @@ class SessionStore:
             advanced_notifications=_safe_bool(data.get("advanced_notifications")),
         )
 
+    def save_async(self, state: SessionState) -> None:
+        self._pending = state
+
+    def flush(self) -> None:
+        state, self._pending = self._pending, None
+        if state is not None:
+            self.save(state)
+
     def save(self, state: SessionState) -> None:
+        self._pending = None
         payload = {
             "dirty": bool(state.dirty),
             "paths": list(state.paths),
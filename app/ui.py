@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import ctypes
 import json
 import os
 import re
 import shutil
 import subprocess
+import sys
 import tempfile
+import time
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
 
 from PySide6 import QtCore, QtGui, QtWidgets
@@ -39,11 +45,13 @@ from app.model_installation import (
 )
 from app.model_selection import recommend_execution_plan
 from app.output_metadata import metadata_loss_warning
+from app.preview_cache import PreviewCache, resolve_preview_cache_dir
 from app.processing_report import (
     ProcessingTimings,
     build_processing_report,
     export_processing_report,
 )
+from app.provider_detection import recommend_provider
 from app.run_settings import (
     RunSettings,
     parse_compute,
@@ -63,18 +71,17 @@ from app.upscale_execution import (
 )
 
 
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+@lru_cache(maxsize=1024)
 def _format_bytes(size_bytes: int) -> str:
     if size_bytes < 0:
         return "Unknown"
-    units = ["B", "KB", "MB", "GB", "TB"]
-    size = float(size_bytes)
-    for unit in units:
-        if size < 1024 or unit == units[-1]:
-            if unit == "B":
-                return f"{int(size)} {unit}"
-            return f"{size:.1f} {unit}"
-        size /= 1024
-    return f"{size:.1f} TB"
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
+    index = min((size_bytes.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * index)):.1f} {_BYTE_UNITS[index]}"
 
 
 def _format_pixel_size(
@@ -89,19 +96,104 @@ def _format_pixel_size(
     return f"{x_size:.6f} x {y_size:.6f}"
 
 
+_NVIDIA_SMI_TIMEOUT_S = 2.0
+_RESIZE_SETTLE_DELAY_MS = 150
+_SLIDER_FRAME_INTERVAL_MS = 16
+_PIXMAP_CACHE_LIMIT_KB = 65536
+_LIST_BATCH_SIZE = 64
+_SESSION_AUTOSAVE_DELAY_MS = 1500
+_SESSION_PERSIST_DEBOUNCE_MS = 250
+_PATH_EXISTS_TTL_S = 2.0
+_PREVIEW_MAX_EDGE = 2048
+
+_VERSION_PATH_RE = re.compile(r"/download/(v[^/]+)/")
+_VERSION_TAG_RE = re.compile(r"\bv\d+\.\d+(?:\.\d+)?\b")
+_CUDA_VERSION_RE = re.compile(r"CUDA Version:\s*([0-9.]+)")
+_SLUG_SEPARATOR_RE = re.compile(r"[\W_]+")
+
+_QT_FORMAT_NAMES: dict[bytes, str] = {
+    b"bmp": "BMP",
+    b"gif": "GIF",
+    b"jp2": "JP2",
+    b"jpeg": "JPEG",
+    b"jpg": "JPG",
+    b"png": "PNG",
+    b"tif": "TIF",
+    b"tiff": "TIFF",
+    b"webp": "WEBP",
+}
+
+
+_HEADER_PROBE_FORMATS = frozenset({None, "Unknown", "Not an image", "TIFF", "TIF"})
+
+
+@lru_cache(maxsize=1)
+def _register_supported_formats() -> None:
+    for fmt in QtGui.QImageReader.supportedImageFormats():
+        raw = fmt.data()
+        _QT_FORMAT_NAMES.setdefault(raw, raw.decode("ascii", errors="ignore").upper())
+
+
+def _qt_format_name(fmt: QtCore.QByteArray) -> str:
+    if not fmt:
+        return "Unknown"
+    raw = fmt.data()
+    name = _QT_FORMAT_NAMES.get(raw)
+    if name is None:
+        name = raw.decode("ascii", errors="ignore").upper()
+        _QT_FORMAT_NAMES[raw] = name
+    return name
+
+
+@lru_cache(maxsize=256)
 def _extract_model_version(weights_url: str) -> str | None:
     if not weights_url:
         return None
-    match = re.search(r"/download/(v[^/]+)/", weights_url)
+    match = _VERSION_PATH_RE.search(weights_url)
     if match:
         return match.group(1)
-    match = re.search(r"\bv\d+\.\d+(?:\.\d+)?\b", weights_url)
+    match = _VERSION_TAG_RE.search(weights_url)
     if match:
         return match.group(0)
     return None
 
 
-def _detect_gpu_info() -> str:
+@lru_cache(maxsize=1)
+def _probe_nvml() -> tuple[str, str | None] | None:
+    try:
+        import pynvml
+    except ImportError:
+        return None
+    try:
+        pynvml.nvmlInit()
+    except pynvml.NVMLError:
+        return None
+    try:
+        names = []
+        for index in range(pynvml.nvmlDeviceGetCount()):
+            name = pynvml.nvmlDeviceGetName(pynvml.nvmlDeviceGetHandleByIndex(index))
+            names.append(name.decode() if isinstance(name, bytes) else name)
+        try:
+            version = pynvml.nvmlSystemGetCudaDriverVersion_v2()
+        except pynvml.NVMLError:
+            cuda_version = None
+        else:
+            cuda_version = f"{version // 1000}.{(version % 1000) // 10}"
+    except pynvml.NVMLError:
+        return None
+    finally:
+        try:
+            pynvml.nvmlShutdown()
+        except pynvml.NVMLError:
+            pass
+    return ", ".join(names) or "Not detected", cuda_version
+
+
+@lru_cache(maxsize=1)
+def _probe_nvidia() -> str:
+    nvml = _probe_nvml()
+    if nvml is not None:
+        return nvml[0]
     if shutil.which("nvidia-smi") is None:
         return "Not detected"
     try:
@@ -110,8 +202,10 @@ def _detect_gpu_info() -> str:
             capture_output=True,
             text=True,
             check=False,
+            timeout=_NVIDIA_SMI_TIMEOUT_S,
+            stdin=subprocess.DEVNULL,
         )
-    except OSError:
+    except (OSError, subprocess.TimeoutExpired):
         return "Not detected"
     lines = [line.strip() for line in result.stdout.splitlines() if line.strip()]
     if not lines:
@@ -119,132 +213,341 @@ def _detect_gpu_info() -> str:
     return ", ".join(lines)
 
 
-def _detect_cuda_version() -> str:
-    env_version = os.environ.get("CUDA_VERSION")
-    if env_version:
-        return env_version
-    if shutil.which("nvidia-smi") is None:
+@lru_cache(maxsize=1)
+def _probe_nvidia_cuda() -> str:
+    if _probe_nvidia() == "Not detected":
         return "Not detected"
+    nvml = _probe_nvml()
+    if nvml is not None:
+        return nvml[1] or "Not detected"
     try:
         result = subprocess.run(
             ["nvidia-smi"],
             capture_output=True,
             text=True,
             check=False,
+            timeout=_NVIDIA_SMI_TIMEOUT_S,
+            stdin=subprocess.DEVNULL,
         )
-    except OSError:
+    except (OSError, subprocess.TimeoutExpired):
         return "Not detected"
-    match = re.search(r"CUDA Version:\s*([0-9.]+)", result.stdout)
+    match = _CUDA_VERSION_RE.search(result.stdout)
     if match:
         return match.group(1)
     return "Not detected"
 
 
+@lru_cache(maxsize=1)
+def _driver_cuda_version() -> str | None:
+    library_name = "nvcuda.dll" if os.name == "nt" else "libcuda.so.1"
+    try:
+        library = ctypes.CDLL(library_name)
+        version = ctypes.c_int()
+        status = library.cuDriverGetVersion(ctypes.byref(version))
+    except (OSError, AttributeError):
+        return None
+    if status != 0 or version.value <= 0:
+        return None
+    return f"{version.value // 1000}.{(version.value % 1000) // 10}"
+
+
+def _invalidate_hardware_cache() -> None:
+    for probe in (_probe_nvml, _probe_nvidia, _probe_nvidia_cuda, _driver_cuda_version):
+        probe.cache_clear()
+
+
+def _detect_gpu_info() -> str:
+    return _probe_nvidia()
+
+
+def _detect_cuda_version() -> str:
+    env_version = os.environ.get("CUDA_VERSION")
+    if env_version:
+        return env_version
+    return _driver_cuda_version() or _probe_nvidia_cuda()
+
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_REGISTRY_PATH = os.path.join(_REPO_ROOT, "models", "registry.json")
+_PYPROJECT_PATH = os.path.join(_REPO_ROOT, "pyproject.toml")
+_REGISTRY_CACHE: dict[str, tuple[int, list[dict[str, object]]]] = {}
+
+
 def _load_model_registry() -> list[dict[str, object]]:
-    repo_root = os.path.dirname(os.path.dirname(__file__))
-    registry_path = os.path.join(repo_root, "models", "registry.json")
+    registry_path = _REGISTRY_PATH
+    try:
+        mtime_ns = os.stat(registry_path).st_mtime_ns
+    except OSError:
+        return []
+    cached = _REGISTRY_CACHE.get(registry_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return list(cached[1])
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
     try:
-        with open(registry_path, "r", encoding="utf-8") as handle:
-            data = json.load(handle)
-    except (OSError, json.JSONDecodeError):
+        with open(registry_path, "rb") as handle:
+            raw = handle.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
         return []
     if not isinstance(data, list):
         return []
     entries: list[dict[str, object]] = []
     for entry in data:
         if isinstance(entry, dict):
+            entry["parsed_version"] = _extract_model_version(str(entry.get("weights_url", "")))
             entries.append(entry)
-    return entries
+    _REGISTRY_CACHE[registry_path] = (mtime_ns, entries)
+    return list(entries)
+
+
+def _entry_model_version(entry: dict[str, object]) -> str | None:
+    if "parsed_version" in entry:
+        version = entry["parsed_version"]
+        return str(version) if version else None
+    return _extract_model_version(str(entry.get("weights_url", "")))
 
 
 def _format_model_versions(models: list[dict[str, object]]) -> str:
     if not models:
         return "No models available."
-    lines = []
-    for entry in models:
-        name = str(entry.get("name", "Unknown"))
-        weights_url = str(entry.get("weights_url", ""))
-        version = _extract_model_version(weights_url) or "Unknown"
-        lines.append(f"{name} - {version}")
-    return "\n".join(lines)
+    return "\n".join(
+        f"{entry.get('name', 'Unknown')} - {_entry_model_version(entry) or 'Unknown'}"
+        for entry in models
+    )
+
+
+_APP_VERSION_CACHE: dict[str, tuple[int, str]] = {}
 
 
 def _read_app_version() -> str:
-    pyproject = Path(__file__).resolve().parents[1] / "pyproject.toml"
+    pyproject = _PYPROJECT_PATH
     try:
-        for line in pyproject.read_text(encoding="utf-8").splitlines():
-            stripped = line.strip()
-            if stripped.startswith("version"):
-                _, value = stripped.split("=", 1)
-                return value.strip().strip("\"'")
+        mtime_ns = os.stat(pyproject).st_mtime_ns
     except OSError:
         return "0.0.0"
-    return "0.0.0"
+    cached = _APP_VERSION_CACHE.get(pyproject)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    version = "0.0.0"
+    try:
+        with open(pyproject, "r", encoding="utf-8") as handle:
+            for line in handle:
+                stripped = line.strip()
+                if stripped.startswith("version"):
+                    _, value = stripped.split("=", 1)
+                    version = value.strip().strip("\"'")
+                    break
+    except OSError:
+        return "0.0.0"
+    _APP_VERSION_CACHE[pyproject] = (mtime_ns, version)
+    return version
 
 
 def _slugify_label(value: str) -> str:
-    cleaned: list[str] = []
-    previous_dash = False
-    for char in value.strip().lower():
-        if char.isalnum():
-            cleaned.append(char)
-            previous_dash = False
-            continue
-        if not previous_dash:
-            cleaned.append("-")
-            previous_dash = True
-    slug = "".join(cleaned).strip("-")
+    slug = _SLUG_SEPARATOR_RE.sub("-", value.strip().lower()).strip("-")
     return slug or "model"
 
 
 def _summarize_run_warnings(warnings: list[str]) -> list[str]:
-    unique = [item for item in dict.fromkeys(warnings) if item]
+    unique = dict.fromkeys(warnings)
+    unique.pop("", None)
     if len(unique) <= 2:
-        return unique
+        return list(unique)
+    first, second = islice(unique, 2)
     remaining = len(unique) - 2
-    return [unique[0], unique[1], f"{remaining} additional recommendation warning(s)."]
+    return [first, second, f"{remaining} additional recommendation warning(s)."]
+
+
+@dataclass(slots=True)
+class ModelEntry:
+    name: str
+    bundled: bool
+    installed: bool
+    updating: bool
+    version: str
+    versions: tuple[str, ...]
+    weights_url: str
+    source_url: str
+    license_name: str
+    checksum: str
+    dependencies: tuple[str, ...]
+    license_acceptance_required: bool
+    available: bool
+    availability_reason: str
+
+
+def _scaled_pixmap(
+    source: QtGui.QPixmap,
+    size: QtCore.QSize,
+    aspect_mode: QtCore.Qt.AspectRatioMode,
+    mode: QtCore.Qt.TransformationMode,
+) -> QtGui.QPixmap:
+    key = (
+        f"{source.cacheKey()}@{size.width()}x{size.height()}"
+        f":{aspect_mode.value}:{mode.value}"
+    )
+    cached = QtGui.QPixmapCache.find(key)
+    if cached is not None:
+        return cached
+    scaled = source.scaled(size, aspect_mode, mode)
+    QtGui.QPixmapCache.insert(key, scaled)
+    return scaled
+
+
+@lru_cache(maxsize=None)
+def _shortcut(spec: str) -> QtGui.QKeySequence:
+    return QtGui.QKeySequence(spec)
+
+
+def _configure_long_list(list_widget: QtWidgets.QListWidget) -> None:
+    list_widget.setUniformItemSizes(True)
+    list_widget.setLayoutMode(QtWidgets.QListView.LayoutMode.Batched)
+    list_widget.setBatchSize(_LIST_BATCH_SIZE)
+
+
+def _exceeds_preview_edge(size: QtCore.QSize | None) -> bool:
+    return (
+        size is not None
+        and size.isValid()
+        and max(size.width(), size.height()) > _PREVIEW_MAX_EDGE
+    )
+
+
+def _read_preview_image(reader: QtGui.QImageReader) -> QtGui.QImage | None:
+    size = reader.size()
+    if _exceeds_preview_edge(size):
+        reader.setScaledSize(
+            size.scaled(
+                _PREVIEW_MAX_EDGE,
+                _PREVIEW_MAX_EDGE,
+                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+            )
+        )
+    image = reader.read()
+    if image.isNull():
+        return None
+    return image
+
+
+class PreviewThumbnailTask(QtCore.QRunnable):
+    def __init__(
+        self, image: QtGui.QImage, path: Path, cache: PreviewCache | None = None
+    ) -> None:
+        super().__init__()
+        self._image = image
+        self._path = path
+        self._cache = cache
+
+    def run(self) -> None:
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            handle, tmp_path = tempfile.mkstemp(
+                dir=self._path.parent, prefix=".thumb-", suffix=".png"
+            )
+            os.close(handle)
+        except OSError:
+            return
+        replaced = False
+        try:
+            if self._image.save(tmp_path, "PNG"):
+                os.replace(tmp_path, self._path)
+                replaced = True
+        except OSError:
+            pass
+        finally:
+            if not replaced:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+        if replaced and self._cache is not None:
+            self._cache.prune()
 
 
 _DEFAULT_BUNDLED_MODELS = {"Real-ESRGAN", "Satlas"}
 
 
+@dataclass(frozen=True)
+class ImageProbe:
+    readable: bool
+    format_name: str | None = None
+    size: QtCore.QSize | None = None
+
+
 class PreviewViewer(QtWidgets.QLabel):
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
         self._source_pixmap: QtGui.QPixmap | None = None
+        self._scaled_size: QtCore.QSize | None = None
+        self._scaled_mode: QtCore.Qt.TransformationMode | None = None
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(0)
+        self._resize_timer.timeout.connect(self._update_fast_scaled_pixmap)
+        self._settle_timer = QtCore.QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(_RESIZE_SETTLE_DELAY_MS)
+        self._settle_timer.timeout.connect(self._update_scaled_pixmap)
         self.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         self.setMinimumHeight(220)
         self.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
         self.set_placeholder("Preview will appear here")
 
     def set_placeholder(self, text: str) -> None:
+        if self._source_pixmap is None and self.text() == text:
+            return
         self._source_pixmap = None
+        self._scaled_size = None
+        self._scaled_mode = None
         self.setPixmap(QtGui.QPixmap())
         self.setText(text)
 
     def set_image(self, image: QtGui.QImage) -> None:
-        pixmap = QtGui.QPixmap.fromImage(image)
+        self.set_pixmap(QtGui.QPixmap.fromImage(image))
+
+    def set_pixmap(self, pixmap: QtGui.QPixmap) -> None:
         if pixmap.isNull():
             self.set_placeholder("Preview unavailable for this file.")
             return
         self._source_pixmap = pixmap
+        self._scaled_size = None
+        self._scaled_mode = None
         self._update_scaled_pixmap()
 
     def _update_scaled_pixmap(self) -> None:
+        self._scale_pixmap(QtCore.Qt.TransformationMode.SmoothTransformation)
+
+    def _update_fast_scaled_pixmap(self) -> None:
+        self._scale_pixmap(QtCore.Qt.TransformationMode.FastTransformation)
+
+    def _scale_pixmap(self, mode: QtCore.Qt.TransformationMode) -> None:
         if self._source_pixmap is None:
             return
-        scaled = self._source_pixmap.scaled(
-            self.size(),
+        size = self.size()
+        if size == self._scaled_size and (
+            mode == self._scaled_mode
+            or self._scaled_mode == QtCore.Qt.TransformationMode.SmoothTransformation
+        ):
+            return
+        scaled = _scaled_pixmap(
+            self._source_pixmap,
+            size,
             QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-            QtCore.Qt.TransformationMode.SmoothTransformation,
+            mode,
         )
+        self._scaled_size = QtCore.QSize(size)
+        self._scaled_mode = mode
         self.setPixmap(scaled)
         self.setText("")
 
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
         super().resizeEvent(event)
         if self._source_pixmap is not None:
-            self._update_scaled_pixmap()
+            self._resize_timer.start()
+            self._settle_timer.start()
 
 
 class SideBySideComparison(QtWidgets.QWidget):
@@ -298,6 +601,12 @@ class SideBySideComparison(QtWidgets.QWidget):
             return
         self.after_viewer.set_image(image)
 
+    def set_before_pixmap(self, pixmap: QtGui.QPixmap) -> None:
+        self.before_viewer.set_pixmap(pixmap)
+
+    def set_after_pixmap(self, pixmap: QtGui.QPixmap) -> None:
+        self.after_viewer.set_pixmap(pixmap)
+
     def set_before_placeholder(self, text: str) -> None:
         self.before_viewer.set_placeholder(text)
 
@@ -310,24 +619,47 @@ class SwipeComparisonView(QtWidgets.QFrame):
         super().__init__(parent)
         self._before_pixmap: QtGui.QPixmap | None = None
         self._after_pixmap: QtGui.QPixmap | None = None
+        self._scaled_before: QtGui.QPixmap | None = None
+        self._scaled_after: QtGui.QPixmap | None = None
+        self._scaled_key: tuple[QtCore.QSize, QtCore.Qt.TransformationMode] | None = None
+        self._target = QtCore.QRect()
         self._placeholder_text = "Preview will appear here"
         self._slider_ratio = 0.5
+        self._fast_render = False
+        self._settle_timer = QtCore.QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(_RESIZE_SETTLE_DELAY_MS)
+        self._settle_timer.timeout.connect(self._finish_resize)
         self.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
         self.setMinimumHeight(220)
 
     def set_before_image(self, image: QtGui.QImage | None) -> None:
-        self._before_pixmap = (
+        self.set_before_pixmap(
             QtGui.QPixmap.fromImage(image) if image is not None else None
         )
-        self.update()
 
     def set_after_image(self, image: QtGui.QImage | None) -> None:
-        self._after_pixmap = (
+        self.set_after_pixmap(
             QtGui.QPixmap.fromImage(image) if image is not None else None
         )
+
+    def set_before_pixmap(self, pixmap: QtGui.QPixmap | None) -> None:
+        if pixmap is None and self._before_pixmap is None:
+            return
+        self._before_pixmap = pixmap
+        self._invalidate_scaled()
+        self.update()
+
+    def set_after_pixmap(self, pixmap: QtGui.QPixmap | None) -> None:
+        if pixmap is None and self._after_pixmap is None:
+            return
+        self._after_pixmap = pixmap
+        self._invalidate_scaled()
         self.update()
 
     def set_placeholder(self, text: str) -> None:
+        if text == self._placeholder_text:
+            return
         self._placeholder_text = text
         self.update()
 
@@ -338,22 +670,54 @@ class SwipeComparisonView(QtWidgets.QFrame):
     def has_before_image(self) -> bool:
         return self._before_pixmap is not None and not self._before_pixmap.isNull()
 
-    def _target_rect(self, pixmap: QtGui.QPixmap) -> QtCore.QRect:
-        if pixmap.isNull():
-            return self.rect()
-        scaled = pixmap.scaled(
+    def _transformation_mode(self) -> QtCore.Qt.TransformationMode:
+        if self._fast_render:
+            return QtCore.Qt.TransformationMode.FastTransformation
+        return QtCore.Qt.TransformationMode.SmoothTransformation
+
+    def _finish_resize(self) -> None:
+        self._fast_render = False
+        self.update()
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        super().resizeEvent(event)
+        self._fast_render = True
+        self._settle_timer.start()
+
+    def _invalidate_scaled(self) -> None:
+        self._scaled_before = None
+        self._scaled_after = None
+        self._scaled_key = None
+
+    def _ensure_scaled(self) -> None:
+        mode = self._transformation_mode()
+        key = (self.size(), mode)
+        if key == self._scaled_key:
+            return
+        before = self._before_pixmap
+        scaled_before = _scaled_pixmap(
+            before,
             self.size(),
             QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-            QtCore.Qt.TransformationMode.SmoothTransformation,
+            mode,
         )
-        x = (self.width() - scaled.width()) // 2
-        y = (self.height() - scaled.height()) // 2
-        return QtCore.QRect(x, y, scaled.width(), scaled.height())
+        x = (self.width() - scaled_before.width()) // 2
+        y = (self.height() - scaled_before.height()) // 2
+        self._target = QtCore.QRect(x, y, scaled_before.width(), scaled_before.height())
+        self._scaled_before = scaled_before
+        self._scaled_after = None
+        if self._after_pixmap is not None and not self._after_pixmap.isNull():
+            self._scaled_after = _scaled_pixmap(
+                self._after_pixmap,
+                scaled_before.size(),
+                QtCore.Qt.AspectRatioMode.IgnoreAspectRatio,
+                mode,
+            )
+        self._scaled_key = key
 
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:
         super().paintEvent(event)
         painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.SmoothPixmapTransform)
         painter.fillRect(self.rect(), self.palette().color(QtGui.QPalette.ColorRole.Base))
 
         if self._before_pixmap is None or self._before_pixmap.isNull():
@@ -364,20 +728,19 @@ class SwipeComparisonView(QtWidgets.QFrame):
             )
             return
 
-        target_rect = self._target_rect(self._before_pixmap)
-        painter.drawPixmap(target_rect, self._before_pixmap)
+        self._ensure_scaled()
+        target_rect = self._target
+        painter.drawPixmap(target_rect.topLeft(), self._scaled_before)
 
-        if self._after_pixmap is None or self._after_pixmap.isNull():
+        if self._scaled_after is None:
             return
 
         clip_width = int(target_rect.width() * self._slider_ratio)
-        clip_rect = QtCore.QRect(
-            target_rect.left(), target_rect.top(), clip_width, target_rect.height()
+        painter.drawPixmap(
+            target_rect.topLeft(),
+            self._scaled_after,
+            QtCore.QRect(0, 0, clip_width, target_rect.height()),
         )
-        painter.save()
-        painter.setClipRect(clip_rect)
-        painter.drawPixmap(target_rect, self._after_pixmap)
-        painter.restore()
 
         divider_x = target_rect.left() + clip_width
         divider_pen = QtGui.QPen(self.palette().color(QtGui.QPalette.ColorRole.Highlight))
@@ -407,13 +770,27 @@ class SwipeComparisonWidget(QtWidgets.QWidget):
         slider_layout.addWidget(slider_label)
         slider_layout.addWidget(slider, 1)
 
-        slider.valueChanged.connect(lambda value: view.set_slider_ratio(value / 100.0))
+        slider_timer = QtCore.QTimer(self)
+        slider_timer.setSingleShot(True)
+        slider_timer.setInterval(_SLIDER_FRAME_INTERVAL_MS)
+        slider_timer.timeout.connect(self._apply_pending_slider_ratio)
+        slider.valueChanged.connect(self._queue_slider_ratio)
 
         layout.addWidget(view, 1)
         layout.addWidget(slider_row)
 
         self.view = view
         self.slider = slider
+        self._slider_timer = slider_timer
+        self._pending_slider_ratio = slider.value() / 100.0
+
+    def _queue_slider_ratio(self, value: int) -> None:
+        self._pending_slider_ratio = value / 100.0
+        if not self._slider_timer.isActive():
+            self._slider_timer.start()
+
+    def _apply_pending_slider_ratio(self) -> None:
+        self.view.set_slider_ratio(self._pending_slider_ratio)
 
     def set_before_image(self, image: QtGui.QImage | None) -> None:
         self.view.set_before_image(image)
@@ -421,6 +798,12 @@ class SwipeComparisonWidget(QtWidgets.QWidget):
     def set_after_image(self, image: QtGui.QImage | None) -> None:
         self.view.set_after_image(image)
 
+    def set_before_pixmap(self, pixmap: QtGui.QPixmap | None) -> None:
+        self.view.set_before_pixmap(pixmap)
+
+    def set_after_pixmap(self, pixmap: QtGui.QPixmap | None) -> None:
+        self.view.set_after_pixmap(pixmap)
+
     def set_placeholder(self, text: str) -> None:
         self.view.set_placeholder(text)
 
@@ -456,15 +839,21 @@ class ComparisonViewer(QtWidgets.QWidget):
         if image is None:
             self.set_before_placeholder("Preview will appear here")
             return
-        self.side_by_side.set_before_image(image)
-        self.swipe.set_before_image(image)
+        self.set_before_pixmap(QtGui.QPixmap.fromImage(image))
 
     def set_after_image(self, image: QtGui.QImage | None) -> None:
         if image is None:
             self.set_after_placeholder("Upscaled preview will appear here")
             return
-        self.side_by_side.set_after_image(image)
-        self.swipe.set_after_image(image)
+        self.set_after_pixmap(QtGui.QPixmap.fromImage(image))
+
+    def set_before_pixmap(self, pixmap: QtGui.QPixmap) -> None:
+        self.side_by_side.set_before_pixmap(pixmap)
+        self.swipe.set_before_pixmap(pixmap)
+
+    def set_after_pixmap(self, pixmap: QtGui.QPixmap) -> None:
+        self.side_by_side.set_after_pixmap(pixmap)
+        self.swipe.set_after_pixmap(pixmap)
 
     def set_before_placeholder(self, text: str) -> None:
         self.side_by_side.set_before_placeholder(text)
@@ -486,37 +875,56 @@ class InputListWidget(QtWidgets.QListWidget):
         self.setAcceptDrops(True)
         self.setDragDropMode(QtWidgets.QAbstractItemView.DragDropMode.DropOnly)
         self.setDefaultDropAction(QtCore.Qt.DropAction.CopyAction)
+        _configure_long_list(self)
+        self._paths: dict[str, int] = {}
         self.ensure_placeholder()
 
     def ensure_placeholder(self) -> None:
         if self.count() == 0:
             self.addItem(self.placeholder_text)
 
+    def clear(self) -> None:
+        super().clear()
+        self._paths.clear()
+
+    def paths(self) -> list[str]:
+        return list(self._paths)
+
+    def row_for_path(self, path: str) -> int | None:
+        return self._paths.get(path)
+
     def add_paths(self, paths: list[str]) -> list[str]:
         cleaned = [path for path in paths if path]
         if not cleaned:
             return []
 
-        existing = {self.item(index).text() for index in range(self.count())}
-        placeholder_only = existing == {self.placeholder_text}
+        existing = self._paths
+        placeholder_only = (
+            not existing
+            and self.count() == 1
+            and self.item(0).text() == self.placeholder_text
+        )
         if placeholder_only:
             self.clear()
-            existing = set()
 
-        added_any = False
         added_paths: list[str] = []
+        row = self.count()
         for path in cleaned:
             if path in existing:
                 continue
-            self.addItem(path)
-            existing.add(path)
-            added_any = True
+            existing[path] = row
+            row += 1
             added_paths.append(path)
 
-        if not added_any and self.count() == 0:
-            self.ensure_placeholder()
         if added_paths:
+            self.setUpdatesEnabled(False)
+            try:
+                self.addItems(added_paths)
+            finally:
+                self.setUpdatesEnabled(True)
             self.paths_added.emit(added_paths)
+        elif self.count() == 0:
+            self.ensure_placeholder()
         return added_paths
 
     def _accept_drag(self, event: QtGui.QDragEnterEvent | QtGui.QDragMoveEvent) -> None:
@@ -718,9 +1126,11 @@ class ModelManagerPanel(QtWidgets.QGroupBox):
         self._model_cache_dir = resolve_model_cache_dir()
         self._installer = ModelInstaller(cache_dir=self._model_cache_dir)
         self.cache_dir_input.setText(str(self._model_cache_dir))
-        self.models = self._load_model_registry()
-        self._populate_table()
+        self.models: list[ModelEntry] = []
+        self._row_by_id: dict[int, int] = {}
+        self._combo_versions: tuple[str, ...] = ()
         self._update_action_state()
+        QtCore.QTimer.singleShot(0, self, self._deferred_load)
 
         model_table.itemSelectionChanged.connect(self._handle_selection_change)
         version_combo.currentTextChanged.connect(self._apply_selected_version)
@@ -730,6 +1140,11 @@ class ModelManagerPanel(QtWidgets.QGroupBox):
         browse_button.clicked.connect(self._browse_for_cache_dir)
         reset_button.clicked.connect(self._reset_cache_dir)
 
+    def _deferred_load(self) -> None:
+        self.models = self._load_model_registry()
+        self._populate_table()
+        self._update_action_state()
+
     def model_cache_dir(self) -> Path:
         return self._model_cache_dir
 
@@ -754,15 +1169,17 @@ class ModelManagerPanel(QtWidgets.QGroupBox):
             self.model_cache_dir_changed.emit(str(self._model_cache_dir))
 
     def _refresh_installed_models(self) -> None:
-        for model in self.models:
-            if model.get("bundled"):
-                model["installed"] = True
-            elif self._install_actions_enabled:
-                model["installed"] = self._installer.is_installed(
-                    str(model.get("name", "")),
-                    str(model.get("version", "Latest")),
-                )
-            self._refresh_row_for_model(model)
+        table = self.model_table
+        table.setUpdatesEnabled(False)
+        try:
+            for model in self.models:
+                if model.bundled:
+                    model.installed = True
+                elif self._install_actions_enabled:
+                    model.installed = self._installer.is_installed(model.name, model.version)
+                self._refresh_row_for_model(model)
+        finally:
+            table.setUpdatesEnabled(True)
 
     def _apply_cache_dir_from_text(self) -> None:
         value = self.cache_dir_input.text().strip()
@@ -782,13 +1199,13 @@ class ModelManagerPanel(QtWidgets.QGroupBox):
     def _reset_cache_dir(self) -> None:
         self._apply_cache_dir(None)
 
-    def _load_model_registry(self) -> list[dict[str, object]]:
-        models: list[dict[str, object]] = []
+    def _load_model_registry(self) -> list[ModelEntry]:
+        models: list[ModelEntry] = []
         for entry in _load_model_registry():
-            name = str(entry.get("name", "Unknown"))
+            name = sys.intern(str(entry.get("name", "Unknown")))
             weights_url = str(entry.get("weights_url", ""))
             source_url = str(entry.get("source_url", ""))
-            license_name = str(entry.get("license", "UNVERIFIED"))
+            license_name = sys.intern(str(entry.get("license", "UNVERIFIED")))
             bundled = bool(entry.get("bundled")) or name in _DEFAULT_BUNDLED_MODELS
             license_acceptance_required = bool(entry.get("license_acceptance_required"))
             if not license_acceptance_required:
@@ -803,50 +1220,58 @@ class ModelManagerPanel(QtWidgets.QGroupBox):
                 weights_url=weights_url,
                 checksum=checksum,
             )
-            version = _extract_model_version(weights_url)
-            versions = ["Latest"]
+            version = _entry_model_version(entry)
+            versions: tuple[str, ...] = ("Latest",)
             if version and version not in versions:
-                versions.insert(0, version)
+                versions = (sys.intern(version), *versions)
             resolved_version = versions[0]
             installed = bundled
             if not bundled and self._install_actions_enabled:
                 installed = self._installer.is_installed(name, resolved_version)
             models.append(
-                {
-                    "name": name,
-                    "bundled": bundled,
-                    "installed": installed,
-                    "updating": False,
-                    "version": resolved_version,
-                    "versions": versions,
-                    "weights_url": weights_url,
-                    "source_url": source_url,
-                    "license": license_name,
-                    "checksum": checksum,
-                    "dependencies": dependencies,
-                    "license_acceptance_required": license_acceptance_required,
-                    "available": available,
-                    "availability_reason": availability_reason,
-                }
+                ModelEntry(
+                    name=name,
+                    bundled=bundled,
+                    installed=installed,
+                    updating=False,
+                    version=resolved_version,
+                    versions=versions,
+                    weights_url=weights_url,
+                    source_url=source_url,
+                    license_name=license_name,
+                    checksum=checksum,
+                    dependencies=tuple(str(item) for item in dependencies),
+                    license_acceptance_required=license_acceptance_required,
+                    available=available,
+                    availability_reason=availability_reason,
+                )
             )
         return models
 
     def _populate_table(self) -> None:
-        self.model_table.setRowCount(len(self.models))
-        for row, model in enumerate(self.models):
-            name_item = QtWidgets.QTableWidgetItem(str(model["name"]))
-            version_item = QtWidgets.QTableWidgetItem(str(model["version"]))
-            status_item = QtWidgets.QTableWidgetItem(self._status_text(model))
-            self.model_table.setItem(row, 0, name_item)
-            self.model_table.setItem(row, 1, version_item)
-            self.model_table.setItem(row, 2, status_item)
-
-    def _status_text(self, model: dict[str, object]) -> str:
-        if model.get("updating"):
+        table = self.model_table
+        self._row_by_id = {id(model): row for row, model in enumerate(self.models)}
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.setRowCount(len(self.models))
+            for row, model in enumerate(self.models):
+                name_item = QtWidgets.QTableWidgetItem(model.name)
+                version_item = QtWidgets.QTableWidgetItem(model.version)
+                status_item = QtWidgets.QTableWidgetItem(self._status_text(model))
+                table.setItem(row, 0, name_item)
+                table.setItem(row, 1, version_item)
+                table.setItem(row, 2, status_item)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+
+    def _status_text(self, model: ModelEntry) -> str:
+        if model.updating:
             return "Updating"
-        if not bool(model.get("available", True)) and not model.get("installed"):
+        if not model.available and not model.installed:
             return "Unavailable"
-        return "Installed" if model.get("installed") else "Available"
+        return "Installed" if model.installed else "Available"
 
     def _selected_row(self) -> int | None:
         selected_rows = self.model_table.selectionModel().selectedRows()
@@ -854,7 +1279,7 @@ class ModelManagerPanel(QtWidgets.QGroupBox):
             return None
         return selected_rows[0].row()
 
-    def _selected_model(self) -> dict[str, object] | None:
+    def _selected_model(self) -> ModelEntry | None:
         row = self._selected_row()
         if row is None or row >= len(self.models):
             return None
@@ -866,19 +1291,22 @@ class ModelManagerPanel(QtWidgets.QGroupBox):
             self.selection_label.setText("Select a model to manage.")
             self.status_label.setText("Status: -")
             self.version_combo.clear()
+            self._combo_versions = ()
             self._update_action_state()
             return
 
-        self.selection_label.setText(f"Selected: {model['name']}")
-        if not bool(model.get("available", True)) and not model.get("installed"):
-            reason = str(model.get("availability_reason", "")).strip()
+        self.selection_label.setText(f"Selected: {model.name}")
+        if not model.available and not model.installed:
+            reason = model.availability_reason.strip()
             if reason:
-                self.selection_label.setText(f"Selected: {model['name']} ({reason})")
+                self.selection_label.setText(f"Selected: {model.name} ({reason})")
         self.status_label.setText(f"Status: {self._status_text(model)}")
         self.version_combo.blockSignals(True)
-        self.version_combo.clear()
-        self.version_combo.addItems([str(v) for v in model.get("versions", [])])
-        self.version_combo.setCurrentText(str(model.get("version", "Latest")))
+        if model.versions != self._combo_versions:
+            self.version_combo.clear()
+            self.version_combo.addItems(list(model.versions))
+            self._combo_versions = model.versions
+        self.version_combo.setCurrentText(model.version)
         self.version_combo.blockSignals(False)
         self._update_action_state()
 
@@ -887,11 +1315,9 @@ class ModelManagerPanel(QtWidgets.QGroupBox):
         if row is None:
             return
         model = self.models[row]
-        model["version"] = version
-        if not model.get("bundled") and self._install_actions_enabled:
-            model["installed"] = self._installer.is_installed(
-                str(model.get("name", "")), version
-            )
+        model.version = version
+        if not model.bundled and self._install_actions_enabled:
+            model.installed = self._installer.is_installed(model.name, version)
         version_item = self.model_table.item(row, 1)
         if version_item is not None:
             version_item.setText(version)
@@ -899,12 +1325,12 @@ class ModelManagerPanel(QtWidgets.QGroupBox):
 
     def _install_selected_model(self) -> None:
         model = self._selected_model()
-        if model is None or model.get("bundled") or model.get("updating"):
+        if model is None or model.bundled or model.updating:
             return
-        if model.get("installed"):
+        if model.installed:
             return
-        if not bool(model.get("available", True)):
-            summary = str(model.get("availability_reason", "")).strip()
+        if not model.available:
+            summary = model.availability_reason.strip()
             if not summary:
                 summary = "Required weights/checksum metadata is not available yet."
             self._show_install_error(
@@ -920,15 +1346,15 @@ class ModelManagerPanel(QtWidgets.QGroupBox):
                 )
             )
             return
-        if model.get("license_acceptance_required"):
+        if model.license_acceptance_required:
             if not self._confirm_license_acceptance(model):
                 return
         self._begin_status_update(model, target_installed=True)
 
-    def _confirm_license_acceptance(self, model: dict[str, object]) -> bool:
-        license_name = str(model.get("license", "Unknown"))
-        source_url = str(model.get("source_url", ""))
-        model_name = str(model.get("name", "Model"))
+    def _confirm_license_acceptance(self, model: ModelEntry) -> bool:
+        license_name = model.license_name
+        source_url = model.source_url
+        model_name = model.name
         message = (
             f"{model_name} uses {license_name}.\n\n"
             "This license is optional-only and requires explicit acceptance before install."
@@ -947,9 +1373,9 @@ class ModelManagerPanel(QtWidgets.QGroupBox):
 
     def _uninstall_selected_model(self) -> None:
         model = self._selected_model()
-        if model is None or model.get("bundled") or model.get("updating"):
+        if model is None or model.bundled or model.updating:
             return
-        if not model.get("installed"):
+        if not model.installed:
             return
         self._begin_status_update(model, target_installed=False)
 
@@ -964,10 +1390,9 @@ class ModelManagerPanel(QtWidgets.QGroupBox):
         self.status_label.setText(f"Status: {self._status_text(model)}")
         self._update_action_state()
 
-    def _refresh_row_for_model(self, model: dict[str, object]) -> None:
-        try:
-            row = self.models.index(model)
-        except ValueError:
+    def _refresh_row_for_model(self, model: ModelEntry) -> None:
+        row = self._row_by_id.get(id(model))
+        if row is None:
             return
         status_item = self.model_table.item(row, 2)
         if status_item is not None:
@@ -977,9 +1402,9 @@ class ModelManagerPanel(QtWidgets.QGroupBox):
             self._update_action_state()
 
     def _begin_status_update(
-        self, model: dict[str, object], target_installed: bool
+        self, model: ModelEntry, target_installed: bool
     ) -> None:
-        model["updating"] = True
+        model.updating = True
         self._refresh_row_for_model(model)
         if not self._install_actions_enabled:
             QtCore.QTimer.singleShot(
@@ -993,18 +1418,18 @@ class ModelManagerPanel(QtWidgets.QGroupBox):
         )
 
     def _perform_update(
-        self, model: dict[str, object], target_installed: bool
+        self, model: ModelEntry, target_installed: bool
     ) -> None:
-        final_installed = bool(model.get("installed"))
+        final_installed = model.installed
         error: Exception | None = None
         if target_installed:
             try:
                 self._installer.install(
-                    str(model.get("name", "")),
-                    str(model.get("version", "Latest")),
-                    str(model.get("weights_url", "")),
-                    checksum=str(model.get("checksum", "")),
-                    dependencies=tuple(model.get("dependencies", []) or []),
+                    model.name,
+                    model.version,
+                    model.weights_url,
+                    checksum=model.checksum,
+                    dependencies=model.dependencies,
                 )
                 final_installed = True
             except Exception as exc:  # noqa: BLE001
@@ -1013,8 +1438,8 @@ class ModelManagerPanel(QtWidgets.QGroupBox):
         else:
             try:
                 self._installer.uninstall(
-                    str(model.get("name", "")),
-                    str(model.get("version", "Latest")),
+                    model.name,
+                    model.version,
                 )
                 final_installed = False
             except Exception as exc:  # noqa: BLE001
@@ -1025,10 +1450,10 @@ class ModelManagerPanel(QtWidgets.QGroupBox):
             self._show_install_error(error)
 
     def _complete_status_update(
-        self, model: dict[str, object], target_installed: bool
+        self, model: ModelEntry, target_installed: bool
     ) -> None:
-        model["installed"] = target_installed
-        model["updating"] = False
+        model.installed = target_installed
+        model.updating = False
         self._refresh_row_for_model(model)
 
     def _show_install_error(self, exc: Exception) -> None:
@@ -1043,18 +1468,18 @@ class ModelManagerPanel(QtWidgets.QGroupBox):
             self.uninstall_button.setEnabled(False)
             self.version_combo.setEnabled(False)
             return
-        if model.get("updating"):
+        if model.updating:
             self.install_button.setEnabled(False)
             self.uninstall_button.setEnabled(False)
             self.version_combo.setEnabled(False)
             return
         self.version_combo.setEnabled(True)
-        if model.get("bundled"):
+        if model.bundled:
             self.install_button.setEnabled(False)
             self.uninstall_button.setEnabled(False)
             return
-        installed = bool(model.get("installed"))
-        available = bool(model.get("available", True))
+        installed = model.installed
+        available = model.available
         self.install_button.setEnabled(available and not installed)
         self.uninstall_button.setEnabled(installed)
 
@@ -1087,6 +1512,7 @@ class CollapsiblePanel(QtWidgets.QWidget):
 
         self.content_area = QtWidgets.QWidget()
         self.content_area.setVisible(False)
+        self._expanded = False
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -1097,6 +1523,9 @@ class CollapsiblePanel(QtWidgets.QWidget):
         self.toggle_button.toggled.connect(self._toggle_content)
 
     def _toggle_content(self, expanded: bool) -> None:
+        if expanded == self._expanded:
+            return
+        self._expanded = expanded
         self.content_area.setVisible(expanded)
         self.toggle_button.setArrowType(
             QtCore.Qt.ArrowType.DownArrow if expanded else QtCore.Qt.ArrowType.RightArrow
@@ -1104,6 +1533,17 @@ class CollapsiblePanel(QtWidgets.QWidget):
 
 
 class AdvancedOptionsPanel(CollapsiblePanel):
+    _SCALE_OPTIONS = ("2x", "4x", "8x")
+    _TILING_OPTIONS = ("Auto", "512 px", "1024 px")
+    _PRECISION_OPTIONS = ("Auto", "FP16", "FP32")
+    _COMPUTE_OPTIONS = ("Auto", "GPU", "CPU")
+    _SAFE_MODE_INDEXES = {
+        "scale": _SCALE_OPTIONS.index("2x"),
+        "tiling": _TILING_OPTIONS.index("512 px"),
+        "precision": _PRECISION_OPTIONS.index("FP32"),
+        "compute": _COMPUTE_OPTIONS.index("CPU"),
+    }
+
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__("Advanced Options", parent)
         self.setObjectName("advancedOptionsPanel")
@@ -1121,19 +1561,19 @@ class AdvancedOptionsPanel(CollapsiblePanel):
 
         scale_combo = QtWidgets.QComboBox()
         scale_combo.setObjectName("advancedScaleCombo")
-        scale_combo.addItems(["2x", "4x", "8x"])
+        scale_combo.addItems(list(self._SCALE_OPTIONS))
 
         tiling_combo = QtWidgets.QComboBox()
         tiling_combo.setObjectName("advancedTilingCombo")
-        tiling_combo.addItems(["Auto", "512 px", "1024 px"])
+        tiling_combo.addItems(list(self._TILING_OPTIONS))
 
         precision_combo = QtWidgets.QComboBox()
         precision_combo.setObjectName("advancedPrecisionCombo")
-        precision_combo.addItems(["Auto", "FP16", "FP32"])
+        precision_combo.addItems(list(self._PRECISION_OPTIONS))
 
         compute_combo = QtWidgets.QComboBox()
         compute_combo.setObjectName("advancedComputeCombo")
-        compute_combo.addItems(["Auto", "GPU", "CPU"])
+        compute_combo.addItems(list(self._COMPUTE_OPTIONS))
 
         seam_blend_check = QtWidgets.QCheckBox("Enable seam blending")
         seam_blend_check.setObjectName("advancedSeamBlendCheck")
@@ -1158,11 +1598,13 @@ class AdvancedOptionsPanel(CollapsiblePanel):
         self.seam_blend_check = seam_blend_check
         self.completion_notification_check = completion_notification_check
         self.safe_mode_check = safe_mode_check
-        self._safe_mode_previous: dict[str, object] | None = None
+        self._safe_mode_previous: dict[str, int] | None = None
 
         safe_mode_check.toggled.connect(self._apply_safe_mode_state)
 
     def _apply_safe_mode_state(self, enabled: bool) -> None:
+        if enabled == (self._safe_mode_previous is not None):
+            return
         advanced_controls = [
             self.scale_combo,
             self.tiling_combo,
@@ -1172,38 +1614,40 @@ class AdvancedOptionsPanel(CollapsiblePanel):
             self.completion_notification_check,
         ]
 
-        if enabled:
-            self._safe_mode_previous = {
-                "scale": self.scale_combo.currentText(),
-                "tiling": self.tiling_combo.currentText(),
-                "precision": self.precision_combo.currentText(),
-                "compute": self.compute_combo.currentText(),
-                "seam_blend": self.seam_blend_check.isChecked(),
-            }
-            if self.scale_combo.findText("2x") >= 0:
-                self.scale_combo.setCurrentText("2x")
-            if self.tiling_combo.findText("512 px") >= 0:
-                self.tiling_combo.setCurrentText("512 px")
-            if self.precision_combo.findText("FP32") >= 0:
-                self.precision_combo.setCurrentText("FP32")
-            if self.compute_combo.findText("CPU") >= 0:
-                self.compute_combo.setCurrentText("CPU")
-            self.seam_blend_check.setChecked(False)
-            for control in advanced_controls:
-                control.setEnabled(False)
-            return
+        combos = {
+            "scale": self.scale_combo,
+            "tiling": self.tiling_combo,
+            "precision": self.precision_combo,
+            "compute": self.compute_combo,
+        }
 
-        if self._safe_mode_previous:
-            self.scale_combo.setCurrentText(str(self._safe_mode_previous["scale"]))
-            self.tiling_combo.setCurrentText(str(self._safe_mode_previous["tiling"]))
-            self.precision_combo.setCurrentText(str(self._safe_mode_previous["precision"]))
-            self.compute_combo.setCurrentText(str(self._safe_mode_previous["compute"]))
-            self.seam_blend_check.setChecked(
-                bool(self._safe_mode_previous["seam_blend"])
-            )
-            self._safe_mode_previous = None
+        self.content_area.setUpdatesEnabled(False)
         for control in advanced_controls:
-            control.setEnabled(True)
+            control.blockSignals(True)
+        try:
+            if enabled:
+                self._safe_mode_previous = {
+                    key: combo.currentIndex() for key, combo in combos.items()
+                }
+                self._safe_mode_previous["seam_blend"] = int(
+                    self.seam_blend_check.isChecked()
+                )
+                for key, combo in combos.items():
+                    combo.setCurrentIndex(self._SAFE_MODE_INDEXES[key])
+                self.seam_blend_check.setChecked(False)
+            elif self._safe_mode_previous:
+                for key, combo in combos.items():
+                    combo.setCurrentIndex(self._safe_mode_previous[key])
+                self.seam_blend_check.setChecked(
+                    bool(self._safe_mode_previous["seam_blend"])
+                )
+                self._safe_mode_previous = None
+            for control in advanced_controls:
+                control.setEnabled(not enabled)
+        finally:
+            for control in advanced_controls:
+                control.blockSignals(False)
+            self.content_area.setUpdatesEnabled(True)
 
 
 class ModelComparisonPanel(QtWidgets.QGroupBox):
@@ -1258,13 +1702,20 @@ class ModelComparisonPanel(QtWidgets.QGroupBox):
         self.helper_label = helper_label
         self.model_b_label = model_b_label
         self._models_available = False
+        self._text_cache: dict[str, tuple[str, str]] = {}
         self._load_models()
         self._apply_mode(mode_combo.currentText())
 
+        for combo in (mode_combo, model_a_combo, model_b_combo):
+            combo.currentTextChanged.connect(self._invalidate_text_cache)
         mode_combo.currentTextChanged.connect(self._apply_mode)
         self._batch_mode = False
 
+    def _invalidate_text_cache(self) -> None:
+        self._text_cache.clear()
+
     def _load_models(self) -> None:
+        self._text_cache.clear()
         model_names = self._load_model_names()
         self.model_a_combo.clear()
         self.model_b_combo.clear()
@@ -1281,23 +1732,11 @@ class ModelComparisonPanel(QtWidgets.QGroupBox):
         self.model_b_combo.addItems(["None", *model_names])
 
     def _load_model_names(self) -> list[str]:
-        repo_root = os.path.dirname(os.path.dirname(__file__))
-        registry_path = os.path.join(repo_root, "models", "registry.json")
-        try:
-            with open(registry_path, "r", encoding="utf-8") as handle:
-                data = json.load(handle)
-        except (OSError, json.JSONDecodeError):
-            return []
-        if not isinstance(data, list):
-            return []
-        names: list[str] = []
-        for entry in data:
-            if not isinstance(entry, dict):
-                continue
-            name = entry.get("name")
-            if isinstance(name, str) and name:
-                names.append(name)
-        return names
+        return [
+            name
+            for name in (entry.get("name") for entry in _load_model_registry())
+            if isinstance(name, str) and name
+        ]
 
     def _apply_mode(self, mode: str) -> None:
         comparison = mode == "Model comparison"
@@ -1331,26 +1770,79 @@ class ModelComparisonPanel(QtWidgets.QGroupBox):
         return selection
 
     def comparison_labels(self) -> tuple[str, str]:
+        cached = self._text_cache.get("labels")
+        if cached is not None:
+            return cached
         if not self.is_comparison_mode():
-            return ("Before", "After")
-        model_a = self.selected_model_a()
-        model_b = self.selected_model_b()
-        before_label = "Model A"
-        if model_a:
-            before_label = f"Model A: {model_a}"
-        after_label = "Model B (optional)"
-        if model_b:
-            after_label = f"Model B: {model_b}"
-        return (before_label, after_label)
+            labels = ("Before", "After")
+        else:
+            model_a = self.selected_model_a()
+            model_b = self.selected_model_b()
+            before_label = "Model A"
+            if model_a:
+                before_label = f"Model A: {model_a}"
+            after_label = "Model B (optional)"
+            if model_b:
+                after_label = f"Model B: {model_b}"
+            labels = (before_label, after_label)
+        self._text_cache["labels"] = labels
+        return labels
 
     def placeholder_texts(self) -> tuple[str, str]:
+        cached = self._text_cache.get("placeholders")
+        if cached is not None:
+            return cached
         if not self.is_comparison_mode():
-            return ("Preview will appear here", "Upscaled preview will appear here")
-        before_text = "Model output will appear here"
-        after_text = "Model output will appear here"
-        if self.selected_model_b() is None:
-            after_text = "Select a second model to compare."
-        return (before_text, after_text)
+            texts = ("Preview will appear here", "Upscaled preview will appear here")
+        else:
+            before_text = "Model output will appear here"
+            after_text = "Model output will appear here"
+            if self.selected_model_b() is None:
+                after_text = "Select a second model to compare."
+            texts = (before_text, after_text)
+        self._text_cache["placeholders"] = texts
+        return texts
+
+
+@lru_cache(maxsize=64)
+def _metadata_warning_text(input_format: str | None, output_format: str) -> str:
+    return metadata_loss_warning(input_format, output_format) or ""
+
+
+_EXPORT_PRESETS: tuple[dict[str, str], ...] = (
+    {
+        "name": "Sentinel-2",
+        "description": "Balanced export for Sentinel-2 tiles with multispectral data.",
+        "band_handling": "RGB + all bands",
+        "output_format": "GeoTIFF",
+    },
+    {
+        "name": "PlanetScope",
+        "description": "Optimized for 4-band PlanetScope imagery with RGB focus.",
+        "band_handling": "RGB + all bands",
+        "output_format": "GeoTIFF",
+    },
+    {
+        "name": "Vantor",
+        "description": "High-resolution export with RGB emphasis for WorldView-class data.",
+        "band_handling": "RGB only",
+        "output_format": "GeoTIFF",
+    },
+    {
+        "name": "21AT",
+        "description": (
+            "Conservative export to preserve high-resolution commercial imagery."
+        ),
+        "band_handling": "RGB only",
+        "output_format": "GeoTIFF",
+    },
+    {
+        "name": "Landsat",
+        "description": "Multispectral-aware export tuned for Landsat scenes.",
+        "band_handling": "All bands",
+        "output_format": "GeoTIFF",
+    },
+)
 
 
 class ExportPresetsPanel(QtWidgets.QGroupBox):
@@ -1371,6 +1863,7 @@ class ExportPresetsPanel(QtWidgets.QGroupBox):
         preset_list.setSelectionMode(
             QtWidgets.QAbstractItemView.SelectionMode.SingleSelection
         )
+        _configure_long_list(preset_list)
 
         recommended_row = QtWidgets.QWidget()
         recommended_row_layout = QtWidgets.QHBoxLayout(recommended_row)
@@ -1392,7 +1885,8 @@ class ExportPresetsPanel(QtWidgets.QGroupBox):
         details_form_layout.setSpacing(6)
         band_handling_combo = QtWidgets.QComboBox()
         band_handling_combo.setObjectName("bandHandlingCombo")
-        band_handling_combo.addItems(BandHandling.labels())
+        band_handling_labels = BandHandling.labels()
+        band_handling_combo.addItems(band_handling_labels)
         output_format_combo = QtWidgets.QComboBox()
         output_format_combo.setObjectName("outputFormatCombo")
         output_format_combo.addItems(["Match input", "GeoTIFF", "PNG", "JPEG"])
@@ -1424,7 +1918,12 @@ class ExportPresetsPanel(QtWidgets.QGroupBox):
         self.metadata_warning_label = metadata_warning
         self.preset_description = preset_description
         self._input_format: str | None = None
+        self._last_warning = ""
         self._recommended_label_text = recommended_label.text()
+        self._band_handling_index = {
+            label: index for index, label in enumerate(band_handling_labels)
+        }
+        self._preset_index: dict[str, int] = {}
 
         self._presets = self._build_presets()
         self._populate_presets()
@@ -1434,50 +1933,27 @@ class ExportPresetsPanel(QtWidgets.QGroupBox):
         use_recommended_button.clicked.connect(self._apply_recommended_preset)
         output_format_combo.currentTextChanged.connect(self._update_metadata_warning)
 
-    def _build_presets(self) -> list[dict[str, str]]:
-        return [
-            {
-                "name": "Sentinel-2",
-                "description": "Balanced export for Sentinel-2 tiles with multispectral data.",
-                "band_handling": "RGB + all bands",
-                "output_format": "GeoTIFF",
-            },
-            {
-                "name": "PlanetScope",
-                "description": "Optimized for 4-band PlanetScope imagery with RGB focus.",
-                "band_handling": "RGB + all bands",
-                "output_format": "GeoTIFF",
-            },
-            {
-                "name": "Vantor",
-                "description": "High-resolution export with RGB emphasis for WorldView-class data.",
-                "band_handling": "RGB only",
-                "output_format": "GeoTIFF",
-            },
-            {
-                "name": "21AT",
-                "description": (
-                    "Conservative export to preserve high-resolution commercial imagery."
-                ),
-                "band_handling": "RGB only",
-                "output_format": "GeoTIFF",
-            },
-            {
-                "name": "Landsat",
-                "description": "Multispectral-aware export tuned for Landsat scenes.",
-                "band_handling": "All bands",
-                "output_format": "GeoTIFF",
-            },
-        ]
+    def _build_presets(self) -> tuple[dict[str, str], ...]:
+        return _EXPORT_PRESETS
 
     def _populate_presets(self) -> None:
-        self.preset_list.clear()
-        self.recommended_combo.clear()
-        for preset in self._presets:
-            item = QtWidgets.QListWidgetItem(preset["name"])
-            item.setData(QtCore.Qt.ItemDataRole.UserRole, preset)
-            self.preset_list.addItem(item)
-            self.recommended_combo.addItem(preset["name"])
+        names = [preset["name"] for preset in self._presets]
+        self._preset_index = {name: row for row, name in enumerate(names)}
+        preset_list = self.preset_list
+        preset_list.setUpdatesEnabled(False)
+        preset_list.blockSignals(True)
+        self.recommended_combo.blockSignals(True)
+        try:
+            preset_list.clear()
+            preset_list.addItems(names)
+            for row, preset in enumerate(self._presets):
+                preset_list.item(row).setData(QtCore.Qt.ItemDataRole.UserRole, preset)
+            self.recommended_combo.clear()
+            self.recommended_combo.addItems(names)
+        finally:
+            self.recommended_combo.blockSignals(False)
+            preset_list.blockSignals(False)
+            preset_list.setUpdatesEnabled(True)
 
     def _select_initial_preset(self) -> None:
         if self.preset_list.count() == 0:
@@ -1504,17 +1980,14 @@ class ExportPresetsPanel(QtWidgets.QGroupBox):
         self.select_preset(self.recommended_combo.currentText())
 
     def select_preset(self, name: str) -> None:
-        for index in range(self.preset_list.count()):
-            item = self.preset_list.item(index)
-            if item is None:
-                continue
-            if item.text() == name:
-                self.preset_list.setCurrentRow(index)
-                return
+        row = self._preset_index.get(name)
+        if row is not None:
+            self.preset_list.setCurrentRow(row)
 
     def set_recommended_preset(self, name: str) -> None:
-        if name and self.recommended_combo.findText(name) >= 0:
-            self.recommended_combo.setCurrentText(name)
+        row = self._preset_index.get(name)
+        if row is not None:
+            self.recommended_combo.setCurrentIndex(row)
 
     def set_batch_mode(self, enabled: bool) -> None:
         self.recommended_combo.setEnabled(not enabled)
@@ -1542,24 +2015,44 @@ class ExportPresetsPanel(QtWidgets.QGroupBox):
             if isinstance(band_handling, BandHandling)
             else band_handling
         )
-        if self.band_handling_combo.findText(label) >= 0:
-            self.band_handling_combo.setCurrentText(label)
+        index = self._band_handling_index.get(label)
+        if index is not None:
+            self.band_handling_combo.setCurrentIndex(index)
 
     def set_input_format(self, input_format: str | None) -> None:
         self._input_format = input_format
         self._update_metadata_warning()
 
     def _update_metadata_warning(self) -> None:
-        warning = metadata_loss_warning(self._input_format, self.selected_output_format())
-        if warning:
-            self.metadata_warning_label.setText(warning)
-            self.metadata_warning_label.setVisible(True)
-        else:
-            self.metadata_warning_label.setText("")
-            self.metadata_warning_label.setVisible(False)
+        warning = _metadata_warning_text(self._input_format, self.selected_output_format())
+        if warning == self._last_warning:
+            return
+        self._last_warning = warning
+        self.metadata_warning_label.setText(warning)
+        self.metadata_warning_label.setVisible(bool(warning))
+
+
+class _SystemInfoProbeSignals(QtCore.QObject):
+    finished = QtCore.Signal(str, str, str)
+
+
+class SystemInfoProbeTask(QtCore.QRunnable):
+    def __init__(self) -> None:
+        super().__init__()
+        self.signals = _SystemInfoProbeSignals()
+
+    def run(self) -> None:
+        self.signals.finished.emit(
+            _detect_gpu_info(),
+            _detect_cuda_version(),
+            _format_model_versions(_load_model_registry()),
+        )
 
 
 class SystemInfoPanel(QtWidgets.QGroupBox):
+    _NOT_DETECTED_TEXT = "Not yet detected"
+    _DETECTING_TEXT = "Detecting..."
+
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__("About / System Info", parent)
         self.setObjectName("systemInfoPanel")
@@ -1577,15 +2070,15 @@ class SystemInfoPanel(QtWidgets.QGroupBox):
         info_form_layout.setContentsMargins(0, 0, 0, 0)
         info_form_layout.setSpacing(6)
 
-        gpu_value = QtWidgets.QLabel(_detect_gpu_info())
+        gpu_value = QtWidgets.QLabel(self._NOT_DETECTED_TEXT)
         gpu_value.setObjectName("systemInfoGpuValue")
         gpu_value.setTextInteractionFlags(QtCore.Qt.TextInteractionFlag.TextSelectableByMouse)
 
-        cuda_value = QtWidgets.QLabel(_detect_cuda_version())
+        cuda_value = QtWidgets.QLabel(self._NOT_DETECTED_TEXT)
         cuda_value.setObjectName("systemInfoCudaValue")
         cuda_value.setTextInteractionFlags(QtCore.Qt.TextInteractionFlag.TextSelectableByMouse)
 
-        model_versions = QtWidgets.QLabel(_format_model_versions(_load_model_registry()))
+        model_versions = QtWidgets.QLabel(self._NOT_DETECTED_TEXT)
         model_versions.setObjectName("systemInfoModelVersionsValue")
         model_versions.setWordWrap(True)
         model_versions.setTextInteractionFlags(
@@ -1602,6 +2095,59 @@ class SystemInfoPanel(QtWidgets.QGroupBox):
         self.gpu_value = gpu_value
         self.cuda_value = cuda_value
         self.model_versions_value = model_versions
+        self._detected = False
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super().showEvent(event)
+        if not self._detected:
+            self._detected = True
+            self._start_system_probe()
+
+    def _start_system_probe(self) -> None:
+        for label in (self.gpu_value, self.cuda_value, self.model_versions_value):
+            label.setText(self._DETECTING_TEXT)
+        task = SystemInfoProbeTask()
+        task.signals.finished.connect(self._apply_system_info)
+        self._system_probe_task = task
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def _apply_system_info(self, gpu_info: str, cuda_version: str, model_versions: str) -> None:
+        self.gpu_value.setText(gpu_info)
+        self.cuda_value.setText(cuda_version)
+        self.model_versions_value.setText(model_versions)
+        self._system_probe_task = None
+
+
+_APP_CHANGELOG_ENTRIES: tuple[dict[str, str], ...] = (
+    {
+        "date": "2026-01-20",
+        "title": "Preview workflow polish",
+        "details": (
+            "Refined the preview comparison layout and added clearer empty-state "
+            "messaging for faster review."
+        ),
+    },
+    {
+        "date": "2026-01-05",
+        "title": "Model manager baseline",
+        "details": (
+            "Introduced one-click install/uninstall controls with version visibility."
+        ),
+    },
+)
+
+_MODEL_CHANGELOG_ENTRIES: tuple[dict[str, str], ...] = (
+    {
+        "date": "2026-01-18",
+        "title": "Real-ESRGAN bundled",
+        "details": "Bundled RGB model ready for instant upscaling workflows.",
+    },
+    {
+        "date": "2026-01-12",
+        "title": "Satlas bundled",
+        "details": "Bundled multi-band model tuned for Sentinel-2 scenes.",
+    },
+)
 
 
 class ChangelogPanel(QtWidgets.QGroupBox):
@@ -1633,6 +2179,7 @@ class ChangelogPanel(QtWidgets.QGroupBox):
         update_checks_enabled.setObjectName("updateChecksEnabledCheck")
         check_updates_button = QtWidgets.QPushButton("Check now")
         check_updates_button.setObjectName("checkUpdatesButton")
+        check_updates_button.setEnabled(False)
         update_controls_layout.addWidget(update_checks_enabled)
         update_controls_layout.addWidget(check_updates_button)
         update_controls_layout.addStretch(1)
@@ -1661,7 +2208,7 @@ class ChangelogPanel(QtWidgets.QGroupBox):
         self._populate_list(self.model_list, self._model_entries)
         self._select_initial(self.app_list, self._app_entries, self.app_details)
         self._select_initial(self.model_list, self._model_entries, self.model_details)
-        self._load_update_preference()
+        self._preference_loaded = False
 
         self.app_list.currentRowChanged.connect(
             lambda row: self._apply_entry(row, self._app_entries, self.app_details)
@@ -1685,6 +2232,7 @@ class ChangelogPanel(QtWidgets.QGroupBox):
         changelog_list.setSelectionMode(
             QtWidgets.QAbstractItemView.SelectionMode.SingleSelection
         )
+        _configure_long_list(changelog_list)
 
         details = QtWidgets.QLabel("Select an entry to see details.")
         details.setWordWrap(True)
@@ -1694,54 +2242,32 @@ class ChangelogPanel(QtWidgets.QGroupBox):
         tab_layout.addWidget(details)
         return tab, changelog_list, details
 
-    def _build_app_entries(self) -> list[dict[str, str]]:
-        return [
-            {
-                "date": "2026-01-20",
-                "title": "Preview workflow polish",
-                "details": (
-                    "Refined the preview comparison layout and added clearer empty-state "
-                    "messaging for faster review."
-                ),
-            },
-            {
-                "date": "2026-01-05",
-                "title": "Model manager baseline",
-                "details": (
-                    "Introduced one-click install/uninstall controls with version visibility."
-                ),
-            },
-        ]
+    def _build_app_entries(self) -> tuple[dict[str, str], ...]:
+        return _APP_CHANGELOG_ENTRIES
 
-    def _build_model_entries(self) -> list[dict[str, str]]:
-        entries = [
-            {
-                "date": "2026-01-18",
-                "title": "Real-ESRGAN bundled",
-                "details": "Bundled RGB model ready for instant upscaling workflows.",
-            },
-            {
-                "date": "2026-01-12",
-                "title": "Satlas bundled",
-                "details": "Bundled multi-band model tuned for Sentinel-2 scenes.",
-            },
-        ]
-        return entries
+    def _build_model_entries(self) -> tuple[dict[str, str], ...]:
+        return _MODEL_CHANGELOG_ENTRIES
 
     def _populate_list(
-        self, changelog_list: QtWidgets.QListWidget, entries: list[dict[str, str]]
+        self, changelog_list: QtWidgets.QListWidget, entries: tuple[dict[str, str], ...]
     ) -> None:
-        changelog_list.clear()
-        for entry in entries:
-            label = f"{entry['date']} - {entry['title']}"
-            item = QtWidgets.QListWidgetItem(label)
-            item.setData(QtCore.Qt.ItemDataRole.UserRole, entry)
-            changelog_list.addItem(item)
+        changelog_list.setUpdatesEnabled(False)
+        changelog_list.blockSignals(True)
+        try:
+            changelog_list.clear()
+            changelog_list.addItems(
+                [f"{entry['date']} - {entry['title']}" for entry in entries]
+            )
+            for row, entry in enumerate(entries):
+                changelog_list.item(row).setData(QtCore.Qt.ItemDataRole.UserRole, entry)
+        finally:
+            changelog_list.blockSignals(False)
+            changelog_list.setUpdatesEnabled(True)
 
     def _select_initial(
         self,
         changelog_list: QtWidgets.QListWidget,
-        entries: list[dict[str, str]],
+        entries: tuple[dict[str, str], ...],
         details: QtWidgets.QLabel,
     ) -> None:
         if changelog_list.count() == 0:
@@ -1753,7 +2279,7 @@ class ChangelogPanel(QtWidgets.QGroupBox):
     def _apply_entry(
         self,
         row: int,
-        entries: list[dict[str, str]],
+        entries: tuple[dict[str, str], ...],
         details: QtWidgets.QLabel,
     ) -> None:
         if row < 0 or row >= len(entries):
@@ -1763,9 +2289,17 @@ class ChangelogPanel(QtWidgets.QGroupBox):
         details.setText(f"{entry['date']} - {entry['details']}")
 
 
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super().showEvent(event)
+        if not self._preference_loaded:
+            self._preference_loaded = True
+            self._load_update_preference()
+
     def _load_update_preference(self) -> None:
         preference = self._update_pref_store.load()
+        self.update_checks_enabled.blockSignals(True)
         self.update_checks_enabled.setChecked(preference.enabled)
+        self.update_checks_enabled.blockSignals(False)
         self.check_updates_button.setEnabled(preference.enabled)
         if preference.enabled:
             self.update_status.setText("Update checks are enabled.")
@@ -1797,11 +2331,11 @@ class ChangelogPanel(QtWidgets.QGroupBox):
         model_entries: tuple[dict[str, str], ...],
     ) -> None:
         if app_entries:
-            self._app_entries = list(app_entries)
+            self._app_entries = app_entries
             self._populate_list(self.app_list, self._app_entries)
             self._select_initial(self.app_list, self._app_entries, self.app_details)
         if model_entries:
-            self._model_entries = list(model_entries)
+            self._model_entries = model_entries
             self._populate_list(self.model_list, self._model_entries)
             self._select_initial(self.model_list, self._model_entries, self.model_details)
 
@@ -1811,14 +2345,66 @@ class ChangelogPanel(QtWidgets.QGroupBox):
             name = str(model.get("name", ""))
             if not name:
                 continue
-            weights_url = str(model.get("weights_url", ""))
-            versions[name] = _extract_model_version(weights_url) or "Unknown"
+            versions[name] = _entry_model_version(model) or "Unknown"
         return versions
 
 
+_WORKFLOW_STAGES: tuple[tuple[str, str], ...] = (
+    ("Import", "Choose Files"),
+    ("Review", "Inspect"),
+    ("Stitch (Optional)", "Detect"),
+    ("Recommend", "Recommend Model"),
+    ("Run", "Start"),
+    ("Export", "Save Output"),
+)
+_WORKFLOW_SHORTCUTS = ("Ctrl+1", "Ctrl+2", "Ctrl+3", "Ctrl+4", "Ctrl+5", "Ctrl+6")
+_METADATA_FIELDS = (
+    "Filename",
+    "Path",
+    "Format",
+    "Dimensions",
+    "Provider",
+    "Sensor",
+    "Acquisition time",
+    "Scene ID",
+    "Band count",
+    "Data type",
+    "NoData",
+    "CRS",
+    "Pixel size",
+    "File size",
+    "Modified",
+    "Stitch extent",
+    "Tile boundaries",
+)
+_WORKFLOW_STAGE_SPECS: tuple[tuple[str, str, str, str, str], ...] = tuple(
+    (
+        f"{index}. {stage_label}",
+        action_text,
+        f"workflowStageRow{index}",
+        f"workflowStageLabel{index}",
+        f"workflowStageAction{index}",
+    )
+    for index, (stage_label, action_text) in enumerate(_WORKFLOW_STAGES, start=1)
+)
+_METADATA_FIELD_SPECS: tuple[tuple[str, str], ...] = tuple(
+    (field, f"metadataValue{field.replace(' ', '')}") for field in _METADATA_FIELDS
+)
+
+
 class MainWindow(QtWidgets.QMainWindow):
     run_completed = QtCore.Signal()
     export_completed = QtCore.Signal()
+    session_restored = QtCore.Signal()
+
+    _STAGE_HANDLER_ATTRS: dict[str, str] = {
+        "Import": "_handle_import_stage",
+        "Review": "_handle_review_stage",
+        "Stitch (Optional)": "_handle_stitch_stage",
+        "Recommend": "_handle_recommend_stage",
+        "Run": "_handle_run_clicked",
+        "Export": "_handle_export_stage",
+    }
 
     def __init__(
         self, notification_manager: "DesktopNotificationManager | None" = None
@@ -1826,9 +2412,15 @@ class MainWindow(QtWidgets.QMainWindow):
         super().__init__()
         self.notification_manager = notification_manager or DesktopNotificationManager()
         self.setWindowTitle("Satellite Upscale")
+        _register_supported_formats()
         self._build_ui()
+        self._skip_paths = frozenset({self.input_list.placeholder_text, ""})
         self._configure_shortcuts()
         self._current_preview_image: QtGui.QImage | None = None
+        self._last_comparison_state: tuple[object, ...] | None = None
+        self._last_comparison_image: QtGui.QImage | None = None
+        self._exists_cache: dict[str, tuple[float, bool]] = {}
+        self._last_selection_key: tuple[str, ...] = ()
         self._update_comparison_state()
         self._band_profile_store = BandProfileStore()
         self._model_band_support = load_model_band_support()
@@ -1839,11 +2431,16 @@ class MainWindow(QtWidgets.QMainWindow):
         self._run_cancel_requested = False
         self._run_busy = False
         self._session_store = SessionStore()
-        self._restoring_session = False
+        self._preview_cache: PreviewCache | None = None
+        self._restoring_session = True
         self._session_dirty = False
         self._autosave_timer = QtCore.QTimer(self)
-        self._restore_session_if_needed()
-        self._mark_session_active()
+        self._pending_session_dirty: bool | None = None
+        self._persist_debounce = QtCore.QTimer(self)
+        self._persist_debounce.setSingleShot(True)
+        self._persist_debounce.setInterval(_SESSION_PERSIST_DEBOUNCE_MS)
+        self._persist_debounce.timeout.connect(self._snapshot_session_state)
+        QtCore.QTimer.singleShot(0, self, self._finish_session_startup)
         self._configure_session_autosave()
         self._schedule_model_health_checks()
 
@@ -1909,31 +2506,12 @@ class MainWindow(QtWidgets.QMainWindow):
         metadata_form_layout.setContentsMargins(0, 0, 0, 0)
         metadata_form_layout.setSpacing(8)
         metadata_form_layout.setLabelAlignment(QtCore.Qt.AlignmentFlag.AlignLeft)
-        metadata_fields = [
-            "Filename",
-            "Path",
-            "Format",
-            "Dimensions",
-            "Provider",
-            "Sensor",
-            "Acquisition time",
-            "Scene ID",
-            "Band count",
-            "Data type",
-            "NoData",
-            "CRS",
-            "Pixel size",
-            "File size",
-            "Modified",
-            "Stitch extent",
-            "Tile boundaries",
-        ]
         metadata_value_labels: dict[str, QtWidgets.QLabel] = {}
-        for field in metadata_fields:
+        for field, value_object_name in _METADATA_FIELD_SPECS:
             field_label = QtWidgets.QLabel(field)
             value_label = QtWidgets.QLabel("-")
             value_label.setTextInteractionFlags(QtCore.Qt.TextInteractionFlag.TextSelectableByMouse)
-            value_label.setObjectName(f"metadataValue{field.replace(' ', '')}")
+            value_label.setObjectName(value_object_name)
             metadata_form_layout.addRow(field_label, value_label)
             metadata_value_labels[field] = value_label
         metadata_layout.addWidget(metadata_form)
@@ -1942,26 +2520,24 @@ class MainWindow(QtWidgets.QMainWindow):
         workflow_group.setObjectName("workflowGroup")
         workflow_layout = QtWidgets.QVBoxLayout(workflow_group)
         workflow_layout.setSpacing(8)
-        workflow_stages = [
-            ("Import", "Choose Files"),
-            ("Review", "Inspect"),
-            ("Stitch (Optional)", "Detect"),
-            ("Recommend", "Recommend Model"),
-            ("Run", "Start"),
-            ("Export", "Save Output"),
-        ]
         workflow_stage_labels = []
         workflow_stage_actions = []
-        for index, (stage_label_text, action_text) in enumerate(workflow_stages, start=1):
+        for (
+            stage_label_text,
+            action_text,
+            row_name,
+            label_name,
+            action_name,
+        ) in _WORKFLOW_STAGE_SPECS:
             stage_row = QtWidgets.QWidget()
-            stage_row.setObjectName(f"workflowStageRow{index}")
+            stage_row.setObjectName(row_name)
             stage_row_layout = QtWidgets.QHBoxLayout(stage_row)
             stage_row_layout.setContentsMargins(0, 0, 0, 0)
 
-            stage_label = QtWidgets.QLabel(f"{index}. {stage_label_text}")
-            stage_label.setObjectName(f"workflowStageLabel{index}")
+            stage_label = QtWidgets.QLabel(stage_label_text)
+            stage_label.setObjectName(label_name)
             stage_action = QtWidgets.QPushButton(action_text)
-            stage_action.setObjectName(f"workflowStageAction{index}")
+            stage_action.setObjectName(action_name)
 
             stage_row_layout.addWidget(stage_label, 1)
             stage_row_layout.addWidget(stage_action)
@@ -1969,7 +2545,7 @@ class MainWindow(QtWidgets.QMainWindow):
             workflow_stage_labels.append(stage_label)
             workflow_stage_actions.append(stage_action)
         workflow_layout.addStretch(1)
-        workflow_stage_names = [stage_label for stage_label, _ in workflow_stages]
+        workflow_stage_names = [stage_label for stage_label, _ in _WORKFLOW_STAGES]
 
         run_output_group = QtWidgets.QGroupBox("Run Output")
         run_output_group.setObjectName("runOutputGroup")
@@ -2047,6 +2623,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.model_comparison_panel = model_comparison_panel
         self.metadata_summary = metadata_summary
         self.metadata_value_labels = metadata_value_labels
+        self._metadata_panel = metadata_form
+        self._metadata_items = tuple(metadata_value_labels.items())
         self.workflow_group = workflow_group
         self.workflow_stage_labels = workflow_stage_labels
         self.workflow_stage_actions = workflow_stage_actions
@@ -2074,6 +2652,7 @@ class MainWindow(QtWidgets.QMainWindow):
         input_list.itemSelectionChanged.connect(self._persist_session_state)
         input_list.paths_added.connect(self._select_latest_added)
         input_list.paths_added.connect(self._persist_session_state)
+        input_list.paths_added.connect(self._clear_exists_cache)
         model_comparison_panel.mode_combo.currentTextChanged.connect(
             self._update_comparison_state
         )
@@ -2096,34 +2675,21 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         self._wire_workflow_completion_notifications()
         self._wire_workflow_stage_actions()
-        self._wire_run_action()
 
     def _configure_shortcuts(self) -> None:
-        self.add_files_button.setShortcut(QtGui.QKeySequence("Ctrl+O"))
-        self.add_folder_button.setShortcut(QtGui.QKeySequence("Ctrl+Shift+O"))
-        workflow_shortcuts = [
-            "Ctrl+1",
-            "Ctrl+2",
-            "Ctrl+3",
-            "Ctrl+4",
-            "Ctrl+5",
-            "Ctrl+6",
-        ]
+        self.add_files_button.setShortcut(_shortcut("Ctrl+O"))
+        self.add_folder_button.setShortcut(_shortcut("Ctrl+Shift+O"))
         for action_button, shortcut in zip(
-            self.workflow_stage_actions, workflow_shortcuts, strict=True
+            self.workflow_stage_actions, _WORKFLOW_SHORTCUTS, strict=True
         ):
-            action_button.setShortcut(QtGui.QKeySequence(shortcut))
+            action_button.setShortcut(_shortcut(shortcut))
 
     def _set_completion_notifications_enabled(self, enabled: bool) -> None:
         self.notification_manager.set_enabled(enabled)
 
     def _wire_workflow_completion_notifications(self) -> None:
-        self.run_completed.connect(
-            lambda: self._notify_workflow_completion("Run")
-        )
-        self.export_completed.connect(
-            lambda: self._notify_workflow_completion("Export")
-        )
+        self.run_completed.connect(partial(self._notify_workflow_completion, "Run"))
+        self.export_completed.connect(partial(self._notify_workflow_completion, "Export"))
 
     def _notify_workflow_completion(self, stage_name: str) -> None:
         title = f"{stage_name} complete"
@@ -2136,29 +2702,17 @@ class MainWindow(QtWidgets.QMainWindow):
     def _schedule_export_completion(self) -> None:
         QtCore.QTimer.singleShot(0, self.export_completed.emit)
 
-    def _wire_run_action(self) -> None:
-        if "Run" not in self.workflow_stage_names:
-            return
-        run_index = self.workflow_stage_names.index("Run")
-        if run_index >= len(self.workflow_stage_actions):
-            return
-        self.run_button = self.workflow_stage_actions[run_index]
-        self.run_button.clicked.connect(self._handle_run_clicked)
-
     def _wire_workflow_stage_actions(self) -> None:
-        handlers = {
-            "Import": self._handle_import_stage,
-            "Review": self._handle_review_stage,
-            "Stitch (Optional)": self._handle_stitch_stage,
-            "Recommend": self._handle_recommend_stage,
-            "Export": self._handle_export_stage,
-        }
+        handler_attrs = self._STAGE_HANDLER_ATTRS
         for stage_name, button in zip(
             self.workflow_stage_names, self.workflow_stage_actions, strict=True
         ):
-            handler = handlers.get(stage_name)
-            if handler is not None:
-                button.clicked.connect(handler)
+            attr = handler_attrs.get(stage_name)
+            if attr is None:
+                continue
+            if stage_name == "Run":
+                self.run_button = button
+            button.clicked.connect(getattr(self, attr))
 
     def _set_workflow_message(self, message: str) -> None:
         self.status_bar.showMessage(message)
@@ -2276,7 +2830,6 @@ class MainWindow(QtWidgets.QMainWindow):
                 message = "Recommend: select a single file to set a recommended preset."
             self._set_workflow_message(message)
             return
-        from app.provider_detection import recommend_provider
 
         recommendation = recommend_provider(selected_paths[0])
         if recommendation.ambiguous:
@@ -2356,7 +2909,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 can_retry=True,
             )
 
-        missing_paths = [path for path in resolved_paths if not os.path.exists(path)]
+        missing_paths = [path for path in resolved_paths if not self._path_exists(path)]
         if missing_paths:
             sample_paths = ", ".join(missing_paths[:3])
             if len(missing_paths) > 3:
@@ -2885,6 +3438,7 @@ class MainWindow(QtWidgets.QMainWindow):
     def _update_comparison_preview_from_artifacts(
         self, artifacts: list[UpscaleArtifact]
     ) -> None:
+        self._last_comparison_state = None
         first_artifact = artifacts[0]
         first_path = first_artifact.visual_output_path or first_artifact.master_output_path
         first_image = self._read_image(str(first_path))
@@ -2923,6 +3477,7 @@ class MainWindow(QtWidgets.QMainWindow):
         return base / "upscaled_output"
 
     def _update_after_preview_from_artifact(self, artifact: UpscaleArtifact) -> None:
+        self._last_comparison_state = None
         preview_path = artifact.visual_output_path or artifact.master_output_path
         image = self._read_image(str(preview_path))
         if image is not None:
@@ -3031,10 +3586,9 @@ class MainWindow(QtWidgets.QMainWindow):
         )
 
     def _selected_input_paths(self) -> list[str]:
-        paths = [item.text() for item in self.input_list.selectedItems()]
-        if paths == [self.input_list.placeholder_text]:
-            return []
-        return [path for path in paths if path]
+        skip = self._skip_paths
+        paths = (item.text() for item in self.input_list.selectedItems())
+        return [path for path in paths if path not in skip]
 
     def _current_run_settings(self) -> RunSettings:
         panel = self.advanced_options_panel
@@ -3079,12 +3633,19 @@ class MainWindow(QtWidgets.QMainWindow):
     def _select_latest_added(self, paths: list[str]) -> None:
         if not paths:
             return
-        latest_path = paths[-1]
-        for index in range(self.input_list.count() - 1, -1, -1):
-            if self.input_list.item(index).text() == latest_path:
-                self.input_list.setCurrentRow(index)
-                self.input_list.scrollToItem(self.input_list.item(index))
-                break
+        row = self.input_list.row_for_path(paths[-1])
+        if row is None:
+            return
+        self.input_list.setCurrentRow(row)
+        self.input_list.scrollToItem(self.input_list.item(row))
+
+    def _finish_session_startup(self) -> None:
+        try:
+            self._restore_session_if_needed()
+        finally:
+            self._restoring_session = False
+        self._mark_session_active()
+        self.session_restored.emit()
 
     def _restore_session_if_needed(self) -> None:
         if os.environ.get("SATELLITE_UPSCALE_DISABLE_SESSION_RESTORE") == "1":
@@ -3109,34 +3670,47 @@ class MainWindow(QtWidgets.QMainWindow):
     def _select_session_paths(self, paths: list[str]) -> None:
         if not paths:
             return
-        targets = set(paths)
-        self.input_list.clearSelection()
-        last_selected = None
-        for index in range(self.input_list.count()):
-            item = self.input_list.item(index)
-            if item.text() in targets:
-                item.setSelected(True)
-                last_selected = item
-        if last_selected is not None:
-            self.input_list.scrollToItem(last_selected)
+        input_list = self.input_list
+        rows = sorted(
+            row for row in map(input_list.row_for_path, frozenset(paths)) if row is not None
+        )
+        input_list.setUpdatesEnabled(False)
+        input_list.blockSignals(True)
+        try:
+            input_list.clearSelection()
+            for row in rows:
+                input_list.item(row).setSelected(True)
+        finally:
+            input_list.blockSignals(False)
+            input_list.setUpdatesEnabled(True)
+        input_list.itemSelectionChanged.emit()
+        if rows:
+            input_list.scrollToItem(input_list.item(rows[-1]))
 
     def _current_input_paths(self) -> list[str]:
-        paths = [self.input_list.item(index).text() for index in range(self.input_list.count())]
-        return [
-            path
-            for path in paths
-            if path and path != self.input_list.placeholder_text
-        ]
+        return self.input_list.paths()
 
     def _current_selected_paths(self) -> list[str]:
-        paths = [item.text() for item in self.input_list.selectedItems()]
-        return [
-            path
-            for path in paths
-            if path and path != self.input_list.placeholder_text
-        ]
+        return self._selected_input_paths()
 
     def _persist_session_state(self, *args: object, dirty: bool | None = None) -> None:
+        if self._restoring_session:
+            return
+        if dirty is not None:
+            self._pending_session_dirty = dirty
+        self._persist_debounce.start()
+        self._autosave_timer.start()
+
+    def _snapshot_session_state(self) -> None:
+        self._do_persist_session_state(flush=False)
+
+    def _do_persist_session_state(
+        self, dirty: bool | None = None, *, flush: bool = True
+    ) -> None:
+        self._persist_debounce.stop()
+        if dirty is None:
+            dirty = self._pending_session_dirty
+        self._pending_session_dirty = None
         if self._restoring_session:
             return
         if dirty is None:
@@ -3165,19 +3739,46 @@ class MainWindow(QtWidgets.QMainWindow):
             advanced_notifications=advanced_panel.completion_notification_check.isChecked(),
         )
         self._session_dirty = state.dirty
-        self._session_store.save(state)
+        self._session_store.save_async(state)
+        if flush:
+            self._session_store.flush()
 
     def _mark_session_active(self) -> None:
         self._session_dirty = True
-        self._persist_session_state(dirty=True)
+        self._do_persist_session_state(dirty=True)
 
     def _configure_session_autosave(self) -> None:
-        self._autosave_timer.setInterval(30_000)
+        self._autosave_timer.setSingleShot(True)
+        self._autosave_timer.setInterval(_SESSION_AUTOSAVE_DELAY_MS)
         self._autosave_timer.timeout.connect(self._autosave_session_state)
-        self._autosave_timer.start()
+
+        comparison_panel = self.model_comparison_panel
+        export_panel = self.export_presets_panel
+        advanced_panel = self.advanced_options_panel
+        for combo in (
+            comparison_panel.mode_combo,
+            comparison_panel.model_a_combo,
+            comparison_panel.model_b_combo,
+            export_panel.band_handling_combo,
+            export_panel.output_format_combo,
+            advanced_panel.scale_combo,
+            advanced_panel.tiling_combo,
+            advanced_panel.precision_combo,
+            advanced_panel.compute_combo,
+        ):
+            combo.currentTextChanged.connect(self._persist_session_state)
+        for check in (
+            advanced_panel.seam_blend_check,
+            advanced_panel.safe_mode_check,
+            advanced_panel.completion_notification_check,
+        ):
+            check.toggled.connect(self._persist_session_state)
+        export_panel.preset_list.currentRowChanged.connect(self._persist_session_state)
 
     def _autosave_session_state(self) -> None:
-        self._persist_session_state()
+        if self._persist_debounce.isActive():
+            self._snapshot_session_state()
+        self._session_store.flush()
 
     def _schedule_model_health_checks(self) -> None:
         QtCore.QTimer.singleShot(0, self._run_model_health_checks)
@@ -3236,53 +3837,91 @@ class MainWindow(QtWidgets.QMainWindow):
         )
 
     def _update_comparison_state(self) -> None:
-        before_label, after_label = self.model_comparison_panel.comparison_labels()
-        self.comparison_viewer.set_titles(before_label, after_label)
+        panel = self.model_comparison_panel
+        before_label, after_label = panel.comparison_labels()
+        state = (
+            before_label,
+            after_label,
+            panel.is_comparison_mode(),
+            panel.selected_model_a(),
+            panel.selected_model_b(),
+        )
+        if (
+            state == self._last_comparison_state
+            and self._current_preview_image is self._last_comparison_image
+        ):
+            return
+        self._last_comparison_state = state
+        self._last_comparison_image = self._current_preview_image
+        viewer = self.comparison_viewer
+        viewer.setUpdatesEnabled(False)
+        try:
+            self._apply_comparison_state(*state)
+        finally:
+            viewer.setUpdatesEnabled(True)
 
-        if not self.model_comparison_panel.is_comparison_mode():
-            if self._current_preview_image is None:
-                self.comparison_viewer.set_before_placeholder("Preview will appear here")
+    def _apply_comparison_state(
+        self,
+        before_label: str,
+        after_label: str,
+        comparison_mode: bool,
+        model_a: str | None,
+        model_b: str | None,
+    ) -> None:
+        viewer = self.comparison_viewer
+        image = self._current_preview_image
+        viewer.set_titles(before_label, after_label)
+
+        if not comparison_mode:
+            if image is None:
+                viewer.set_before_placeholder("Preview will appear here")
             else:
-                self.comparison_viewer.set_before_image(self._current_preview_image)
-            self.comparison_viewer.set_after_placeholder("Upscaled preview will appear here")
+                viewer.set_before_image(image)
+            viewer.set_after_placeholder("Upscaled preview will appear here")
             return
 
         before_placeholder, after_placeholder = (
             self.model_comparison_panel.placeholder_texts()
         )
-        if self._current_preview_image is None:
-            self.comparison_viewer.set_before_placeholder(before_placeholder)
-            self.comparison_viewer.set_after_placeholder(after_placeholder)
+        if image is None:
+            viewer.set_before_placeholder(before_placeholder)
+            viewer.set_after_placeholder(after_placeholder)
             return
 
-        if self.model_comparison_panel.selected_model_a() is None:
-            self.comparison_viewer.set_before_placeholder(before_placeholder)
+        if model_a is None:
+            viewer.set_before_placeholder(before_placeholder)
         else:
-            self.comparison_viewer.set_before_image(self._current_preview_image)
+            viewer.set_before_image(image)
 
-        if self.model_comparison_panel.selected_model_b() is None:
-            self.comparison_viewer.set_after_placeholder(after_placeholder)
+        if model_b is None:
+            viewer.set_after_placeholder(after_placeholder)
         else:
-            self.comparison_viewer.set_after_image(self._current_preview_image)
+            viewer.set_after_image(image)
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:  # noqa: N802
         if self._autosave_timer.isActive():
             self._autosave_timer.stop()
-        self._persist_session_state(dirty=False)
+        self._do_persist_session_state(dirty=False, flush=False)
+        self._session_store.flush()
         super().closeEvent(event)
 
     def _handle_selection_change(self) -> None:
+        items = self.input_list.selectedItems()
+        selection_key = tuple(item.text() for item in items)
+        if selection_key == self._last_selection_key:
+            return
+        self._last_selection_key = selection_key
         self._stitch_candidate_signature = None
-        selected_paths = self._selected_input_paths()
+        skip = self._skip_paths
+        selected_paths = [path for path in selection_key if path not in skip]
         self._set_batch_mode(len(selected_paths) > 1)
-        items = self.input_list.selectedItems()
         if len(items) != 1:
             message = "Select a single file to preview."
             preview_metadata: dict[str, str] = {}
             if not items:
                 message = "Select a file to see metadata."
             elif len(items) > 1:
-                paths = [item.text() for item in items]
+                paths = list(selection_key)
                 mosaic_hint = suggest_mosaic(paths)
                 preview_metadata = self._preview_stitch_metadata(paths)
                 if self.model_comparison_panel.is_comparison_mode():
@@ -3300,7 +3939,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.export_presets_panel.set_input_format(None)
             return
 
-        selected_path = items[0].text()
+        selected_path = selection_key[0]
         if selected_path == self.input_list.placeholder_text:
             self._current_preview_image = None
             self._update_comparison_state()
@@ -3323,50 +3962,37 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.workflow_stage_actions[recommend_index].setEnabled(not enabled)
 
     def _load_preview_and_metadata(self, path: str) -> None:
+        self._last_comparison_state = None
         self._update_recommended_preset(path)
-        if not os.path.exists(path):
+        if not self._path_exists(path):
             self._current_preview_image = None
-            if self.model_comparison_panel.is_comparison_mode():
-                self.comparison_viewer.set_before_placeholder(
-                    "Preview unavailable for this file."
-                )
-                self.comparison_viewer.set_after_placeholder(
-                    "Preview unavailable for this file."
-                )
-            else:
-                self.comparison_viewer.set_before_placeholder(
-                    "Preview unavailable for this file."
-                )
-                self.comparison_viewer.set_after_placeholder("Upscaled preview will appear here")
+            self._show_preview_unavailable("Preview unavailable for this file.")
             self.metadata_summary.setText("File not found.")
             self._set_metadata_placeholders()
             self.export_presets_panel.set_input_format(None)
             return
 
-        image = self._read_image(path)
+        image, probe = self._read_image_with_probe(path)
         if image is None:
             self._current_preview_image = None
-            if self.model_comparison_panel.is_comparison_mode():
-                self.comparison_viewer.set_before_placeholder(
-                    "No preview available for this file."
-                )
-                self.comparison_viewer.set_after_placeholder(
-                    "No preview available for this file."
-                )
-            else:
-                self.comparison_viewer.set_before_placeholder(
-                    "No preview available for this file."
-                )
-                self.comparison_viewer.set_after_placeholder("Upscaled preview will appear here")
+            self._show_preview_unavailable("No preview available for this file.")
         else:
             self._current_preview_image = image
             self._update_comparison_state()
-        metadata = self._build_metadata(path)
+        metadata = self._build_metadata(path, probe)
         filename = metadata.get("Filename", os.path.basename(path))
         self.metadata_summary.setText(f"Metadata for {filename}")
         self._set_metadata(metadata)
         self.export_presets_panel.set_input_format(metadata.get("Format"))
 
+    def _show_preview_unavailable(self, message: str) -> None:
+        if self.model_comparison_panel.is_comparison_mode():
+            after_message = message
+        else:
+            after_message = "Upscaled preview will appear here"
+        self.comparison_viewer.set_before_placeholder(message)
+        self.comparison_viewer.set_after_placeholder(after_message)
+
     def _update_recommended_preset(self, path: str) -> None:
         recommendation = self._recommended_preset_for_path(path)
         if recommendation is None:
@@ -3374,8 +4000,6 @@ class MainWindow(QtWidgets.QMainWindow):
         self.export_presets_panel.set_recommended_preset(recommendation)
 
     def _recommended_preset_for_path(self, path: str) -> str | None:
-        from app.provider_detection import recommend_provider
-
         recommendation = recommend_provider(path)
         return recommendation.best
 
@@ -3401,14 +4025,55 @@ class MainWindow(QtWidgets.QMainWindow):
             return selection
         return None
 
+    def _path_exists(self, path: str) -> bool:
+        now = time.monotonic()
+        cached = self._exists_cache.get(path)
+        if cached is not None and now - cached[0] < _PATH_EXISTS_TTL_S:
+            return cached[1]
+        exists = os.path.exists(path)
+        self._exists_cache[path] = (now, exists)
+        return exists
+
+    def _current_preview_cache(self) -> PreviewCache:
+        cache_dir = resolve_preview_cache_dir(self.model_manager_panel.model_cache_dir())
+        if self._preview_cache is None or self._preview_cache.cache_dir != cache_dir:
+            self._preview_cache = PreviewCache(cache_dir)
+        return self._preview_cache
+
+    def _clear_exists_cache(self, *args: object) -> None:
+        self._exists_cache.clear()
+
     def _read_image(self, path: str) -> QtGui.QImage | None:
         reader = QtGui.QImageReader(path)
         if not reader.canRead():
             return None
-        image = reader.read()
-        if image.isNull():
-            return None
-        return image
+        return _read_preview_image(reader)
+
+    def _read_image_with_probe(self, path: str) -> tuple[QtGui.QImage | None, ImageProbe]:
+        reader = QtGui.QImageReader(path)
+        if not reader.canRead():
+            return None, ImageProbe(readable=False)
+        probe = ImageProbe(
+            readable=True,
+            format_name=_qt_format_name(reader.format()),
+            size=reader.size(),
+        )
+        preview_cache = None
+        thumbnail_path = None
+        if _exceeds_preview_edge(probe.size):
+            preview_cache = self._current_preview_cache()
+            thumbnail_path = preview_cache.thumbnail_path(path)
+            if thumbnail_path is not None and thumbnail_path.exists():
+                thumbnail = QtGui.QImage(str(thumbnail_path))
+                if not thumbnail.isNull():
+                    preview_cache.touch(thumbnail_path)
+                    return thumbnail, probe
+        image = _read_preview_image(reader)
+        if image is not None and thumbnail_path is not None:
+            QtCore.QThreadPool.globalInstance().start(
+                PreviewThumbnailTask(image, thumbnail_path, preview_cache)
+            )
+        return image, probe
 
     def _preview_stitch_metadata(self, paths: list[str]) -> dict[str, str]:
         preview = preview_stitch_bounds(paths)
@@ -3419,33 +4084,27 @@ class MainWindow(QtWidgets.QMainWindow):
             "Tile boundaries": preview.boundaries,
         }
 
-    def _build_metadata(self, path: str) -> dict[str, str]:
-        info = QtCore.QFileInfo(path)
-        metadata: dict[str, str] = {
-            "Filename": info.fileName() or "Unknown",
-            "Path": info.absoluteFilePath() or path,
-            "File size": _format_bytes(info.size()),
-            "Modified": info.lastModified().toString(QtCore.Qt.DateFormat.ISODate) or "Unknown",
-            "Provider": "Unknown",
-            "Sensor": "Unknown",
-            "Acquisition time": "Unknown",
-            "Scene ID": "Unknown",
-            "Band count": "Unknown",
-            "Data type": "Unknown",
-            "NoData": "Unknown",
-            "CRS": "Unknown",
-            "Pixel size": "Unknown",
-        }
-        reader = QtGui.QImageReader(path)
+    def _build_metadata(self, path: str, probe: ImageProbe | None = None) -> dict[str, str]:
         fmt_text = None
         dimensions = None
-        if reader.canRead():
-            fmt = reader.format()
-            fmt_text = fmt.data().decode("ascii", errors="ignore").upper() if fmt else "Unknown"
-            size = reader.size()
-            if size.isValid():
-                dimensions = f"{size.width()} x {size.height()} px"
-        header_info = extract_image_header_info(path)
+        header_info = None
+        header_checked = False
+        if probe is not None:
+            fmt_text = probe.format_name
+            size = probe.size
+        else:
+            header_info = extract_image_header_info(path)
+            header_checked = True
+            size = None
+            if header_info is None or not (header_info.width and header_info.height):
+                reader = QtGui.QImageReader(path)
+                if reader.canRead():
+                    fmt_text = _qt_format_name(reader.format())
+                    size = reader.size()
+        if size is not None and size.isValid():
+            dimensions = f"{size.width()} x {size.height()} px"
+        if not header_checked and (dimensions is None or fmt_text in _HEADER_PROBE_FORMATS):
+            header_info = extract_image_header_info(path)
         if header_info is not None:
             if fmt_text in {None, "Unknown", "Not an image"}:
                 fmt_text = header_info.format
@@ -3457,8 +4116,33 @@ class MainWindow(QtWidgets.QMainWindow):
             fmt_text = "Not an image"
         if dimensions is None:
             dimensions = "Unknown"
-        metadata["Format"] = fmt_text or "Unknown"
-        metadata["Dimensions"] = dimensions
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            file_size = -1
+            modified = "Unknown"
+        else:
+            file_size = stat_result.st_size
+            modified = datetime.fromtimestamp(stat_result.st_mtime).isoformat(
+                timespec="seconds"
+            )
+        metadata: dict[str, str] = {
+            "Filename": os.path.basename(path) or "Unknown",
+            "Path": os.path.abspath(path).replace(os.sep, "/"),
+            "Format": fmt_text or "Unknown",
+            "Dimensions": dimensions,
+            "File size": _format_bytes(file_size),
+            "Modified": modified,
+            "Provider": "Unknown",
+            "Sensor": "Unknown",
+            "Acquisition time": "Unknown",
+            "Scene ID": "Unknown",
+            "Band count": "Unknown",
+            "Data type": "Unknown",
+            "NoData": "Unknown",
+            "CRS": "Unknown",
+            "Pixel size": "Unknown",
+        }
 
         try:
             dataset = analyze_dataset(path)
@@ -3483,18 +4167,31 @@ class MainWindow(QtWidgets.QMainWindow):
         return metadata
 
     def _set_metadata_placeholders(self) -> None:
-        for label in self.metadata_value_labels.values():
-            label.setText("-")
+        self._metadata_panel.setUpdatesEnabled(False)
+        try:
+            for _, label in self._metadata_items:
+                label.setText("-")
+        finally:
+            self._metadata_panel.setUpdatesEnabled(True)
 
     def _set_metadata(self, metadata: dict[str, str]) -> None:
-        for field, label in self.metadata_value_labels.items():
-            label.setText(metadata.get(field, "-"))
+        self._metadata_panel.setUpdatesEnabled(False)
+        try:
+            get = metadata.get
+            for field, label in self._metadata_items:
+                label.setText(get(field, "-"))
+        finally:
+            self._metadata_panel.setUpdatesEnabled(True)
 
 
 def create_app() -> QtWidgets.QApplication:
     app = QtWidgets.QApplication.instance()
     if app is None:
+        QtCore.QCoreApplication.setAttribute(
+            QtCore.Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents, True
+        )
         app = QtWidgets.QApplication([])
+        QtGui.QPixmapCache.setCacheLimit(_PIXMAP_CACHE_LIMIT_KB)
     return app
 
 
@@ -3513,15 +4210,11 @@ class DesktopNotificationManager:
     ) -> bool:
         if not self._enabled:
             return False
-        if not QtWidgets.QSystemTrayIcon.isSystemTrayAvailable():
-            return False
         if self._tray_icon is None:
-            icon = parent.windowIcon() if parent is not None else QtGui.QIcon()
-            if icon.isNull() and parent is not None:
-                icon = parent.style().standardIcon(
-                    QtWidgets.QStyle.StandardPixmap.SP_ComputerIcon
-                )
-            self._tray_icon = QtWidgets.QSystemTrayIcon(icon, parent)
+            if not QtWidgets.QSystemTrayIcon.isSystemTrayAvailable():
+                return False
+            self._tray_icon = QtWidgets.QSystemTrayIcon(self._resolve_icon(parent), parent)
+        if not self._tray_icon.isVisible():
             self._tray_icon.setVisible(True)
         self._tray_icon.showMessage(
             title,
@@ -3530,6 +4223,14 @@ class DesktopNotificationManager:
         )
         return True
 
+    def _resolve_icon(self, parent: QtWidgets.QWidget | None) -> QtGui.QIcon:
+        if parent is None:
+            return QtGui.QIcon()
+        icon = parent.windowIcon()
+        if icon.isNull():
+            icon = parent.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_ComputerIcon)
+        return icon
+
 
 def main() -> int:
     app = create_app()
@@ -1,5 +1,6 @@
 import os
 import unittest
+from unittest import mock
 
 try:
     from PySide6 import QtWidgets
@@ -41,6 +42,37 @@ class TestExportMetadataWarning(unittest.TestCase):
 
         self.assertFalse(panel.metadata_warning_label.isVisible())
 
+    def test_unchanged_warning_skips_label_updates(self) -> None:
+        from app.ui import ExportPresetsPanel
+
+        panel = ExportPresetsPanel()
+        panel.output_format_combo.setCurrentText("PNG")
+        panel.set_input_format("GeoTIFF")
+        label = panel.metadata_warning_label
+        with mock.patch.object(label, "setText") as set_text, mock.patch.object(
+            label, "setVisible"
+        ) as set_visible:
+            panel.set_input_format("GeoTIFF")
+            panel._update_metadata_warning()
+
+        set_text.assert_not_called()
+        set_visible.assert_not_called()
+
+    def test_repeated_format_pairs_reuse_cached_warning(self) -> None:
+        from app import ui
+
+        ui._metadata_warning_text.cache_clear()
+        with mock.patch(
+            "app.ui.metadata_loss_warning", wraps=ui.metadata_loss_warning
+        ) as build_warning:
+            first = ui._metadata_warning_text("GeoTIFF", "PNG")
+            second = ui._metadata_warning_text("GeoTIFF", "PNG")
+        ui._metadata_warning_text.cache_clear()
+
+        self.assertEqual(build_warning.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertIn("geospatial metadata", first)
+
 
 if __name__ == "__main__":
     unittest.main()
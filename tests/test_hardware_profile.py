@@ -1,7 +1,8 @@
+import subprocess
 import unittest
 from unittest import mock
 
-from app.hardware_profile import detect_hardware_profile
+from app.hardware_profile import _detect_vram_gb, _gpu_detected, detect_hardware_profile
 
 
 class TestHardwareProfile(unittest.TestCase):
@@ -42,6 +43,21 @@ class TestHardwareProfile(unittest.TestCase):
         self.assertEqual(profile.vram_gb, 0)
         self.assertEqual(profile.ram_gb, 24)
 
+    def test_nvidia_smi_timeout_reports_no_gpu(self) -> None:
+        with (
+            mock.patch("app.hardware_profile.shutil.which", return_value="/usr/bin/nvidia-smi"),
+            mock.patch(
+                "app.hardware_profile.subprocess.run",
+                side_effect=subprocess.TimeoutExpired(["nvidia-smi"], 2.0),
+            ) as run,
+        ):
+            self.assertFalse(_gpu_detected())
+            self.assertEqual(_detect_vram_gb(), 0)
+
+        for call in run.call_args_list:
+            self.assertIn("timeout", call.kwargs)
+            self.assertIs(call.kwargs["stdin"], subprocess.DEVNULL)
+
 
 if __name__ == "__main__":
     unittest.main()
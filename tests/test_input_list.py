@@ -1,5 +1,6 @@
 import os
 import unittest
+from unittest import mock
 
 
 try:
@@ -34,6 +35,50 @@ class TestInputListWidget(unittest.TestCase):
         self.assertEqual(widget.count(), 2)
         self.assertEqual(widget.item(1).text(), "/tmp/example2.tif")
 
+    def test_paths_track_added_order_without_placeholder(self) -> None:
+        from app.ui import InputListWidget
+
+        widget = InputListWidget()
+        self.assertEqual(widget.paths(), [])
+
+        widget.add_paths(["/tmp/b.tif", "/tmp/a.tif", "/tmp/b.tif"])
+        widget.add_paths(["/tmp/c.tif"])
+        self.assertEqual(widget.paths(), ["/tmp/b.tif", "/tmp/a.tif", "/tmp/c.tif"])
+
+        self.assertEqual(widget.row_for_path("/tmp/c.tif"), 2)
+        self.assertEqual(widget.item(2).text(), "/tmp/c.tif")
+
+        widget.clear()
+        self.assertEqual(widget.paths(), [])
+        self.assertIsNone(widget.row_for_path("/tmp/c.tif"))
+
+    def test_clear_resets_known_paths(self) -> None:
+        from app.ui import InputListWidget
+
+        widget = InputListWidget()
+        widget.add_paths(["/tmp/example.tif"])
+        widget.clear()
+        widget.ensure_placeholder()
+
+        self.assertEqual(widget.add_paths(["/tmp/example.tif"]), ["/tmp/example.tif"])
+        self.assertEqual(widget.count(), 1)
+        self.assertEqual(widget.item(0).text(), "/tmp/example.tif")
+
+    def test_bulk_add_inserts_rows_in_one_call(self) -> None:
+        from app.ui import InputListWidget
+
+        widget = InputListWidget()
+        paths = [f"/tmp/bulk_{index}.tif" for index in range(200)]
+        with mock.patch.object(
+            widget, "addItem", wraps=widget.addItem
+        ) as add_item, mock.patch.object(widget, "addItems", wraps=widget.addItems) as add_items:
+            self.assertEqual(widget.add_paths(paths + paths[:10]), paths)
+
+        add_item.assert_not_called()
+        add_items.assert_called_once_with(paths)
+        self.assertEqual(widget.row_for_path(paths[-1]), widget.count() - 1)
+        self.assertTrue(widget.updatesEnabled())
+
     def test_drag_drop_settings(self) -> None:
         from app.ui import InputListWidget
 
@@ -44,6 +89,14 @@ class TestInputListWidget(unittest.TestCase):
             QtWidgets.QAbstractItemView.DragDropMode.DropOnly,
         )
 
+    def test_long_list_uses_batched_uniform_layout(self) -> None:
+        from app.ui import InputListWidget
+
+        widget = InputListWidget()
+        self.assertTrue(widget.uniformItemSizes())
+        self.assertEqual(widget.layoutMode(), QtWidgets.QListView.LayoutMode.Batched)
+        self.assertEqual(widget.batchSize(), 64)
+
 
 @unittest.skipUnless(PYSIDE_AVAILABLE, "PySide6 is required for input list tests")
 class TestImportButtons(unittest.TestCase):
@@ -63,6 +116,18 @@ class TestImportButtons(unittest.TestCase):
         self.assertEqual(window.add_folder_button.objectName(), "addFolderButton")
         self.assertEqual(window.add_folder_button.text(), "Add Folder")
 
+    def test_selected_paths_skip_placeholder(self) -> None:
+        from app.ui import MainWindow
+
+        window = MainWindow()
+        window.input_list.item(0).setSelected(True)
+        self.assertEqual(window._selected_input_paths(), [])
+
+        window.input_list.add_paths(["/tmp/example.tif"])
+        window.input_list.item(0).setSelected(True)
+        self.assertEqual(window._selected_input_paths(), ["/tmp/example.tif"])
+        self.assertEqual(window._current_selected_paths(), ["/tmp/example.tif"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import tempfile
 import unittest
+from unittest import mock
 
 
 try:
@@ -126,3 +127,22 @@ class TestCompletionNotifications(unittest.TestCase):
             fake_manager.calls,
             [("Export complete", "Export finished. You're ready for the next step.")],
         )
+
+    def test_tray_availability_checked_only_until_icon_exists(self) -> None:
+        from app.ui import DesktopNotificationManager
+
+        manager = DesktopNotificationManager()
+        parent = QtWidgets.QWidget()
+        with mock.patch.object(
+            QtWidgets.QSystemTrayIcon, "isSystemTrayAvailable", return_value=True
+        ) as available:
+            self.assertFalse(manager.notify("Run complete", "Done", parent=parent))
+            available.assert_not_called()
+
+            manager.set_enabled(True)
+            self.assertTrue(manager.notify("Run complete", "Done", parent=parent))
+            self.assertTrue(manager.notify("Export complete", "Done", parent=parent))
+
+        available.assert_called_once_with()
+        self.assertFalse(manager._tray_icon.icon().isNull())
+        manager.set_enabled(False)
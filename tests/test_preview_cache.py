@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app.preview_cache import PREVIEW_CACHE_ENV, PreviewCache, resolve_preview_cache_dir
+
+
+class TestPreviewCache(unittest.TestCase):
+    def test_thumbnail_path_tracks_source_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "scene.tif"
+            source.write_bytes(b"before")
+            cache = PreviewCache(cache_dir=Path(tmpdir) / "thumbs")
+
+            first = cache.thumbnail_path(source)
+            self.assertEqual(cache.thumbnail_path(source), first)
+            self.assertEqual(first.parent, cache.cache_dir)
+
+            stat = source.stat()
+            os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertNotEqual(cache.thumbnail_path(source), first)
+
+    def test_missing_source_has_no_thumbnail(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PreviewCache(cache_dir=Path(tmpdir))
+            self.assertIsNone(cache.thumbnail_path(Path(tmpdir) / "missing.tif"))
+
+    def _write_entries(self, cache_dir: Path, count: int, size: int) -> list[Path]:
+        paths = []
+        for index in range(count):
+            path = cache_dir / f"{index:040d}.png"
+            path.write_bytes(b"x" * size)
+            os.utime(path, ns=(index * 1_000_000_000, index * 1_000_000_000))
+            paths.append(path)
+        return paths
+
+    def test_prune_evicts_oldest_entries_over_count(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir)
+            paths = self._write_entries(cache_dir, 5, 10)
+            in_flight = cache_dir / ".thumb-pending.png"
+            in_flight.write_bytes(b"x")
+
+            cache = PreviewCache(cache_dir=cache_dir, max_entries=3)
+            cache.touch(paths[0])
+            cache.prune()
+
+            remaining = sorted(path.name for path in cache_dir.iterdir())
+            expected = sorted(path.name for path in (paths[0], paths[3], paths[4]))
+            self.assertEqual(remaining, sorted([*expected, in_flight.name]))
+
+    def test_prune_evicts_oldest_entries_over_size(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir)
+            paths = self._write_entries(cache_dir, 4, 100)
+
+            PreviewCache(cache_dir=cache_dir, max_bytes=250).prune()
+
+            self.assertEqual(
+                sorted(path.name for path in cache_dir.iterdir()),
+                [paths[2].name, paths[3].name],
+            )
+
+    def test_cache_dir_follows_model_cache_dir(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch.dict(os.environ):
+            os.environ.pop(PREVIEW_CACHE_ENV, None)
+            model_dir = Path(tmpdir) / "models"
+            self.assertEqual(resolve_preview_cache_dir(model_dir).parent, model_dir)
+
+            os.environ[PREVIEW_CACHE_ENV] = str(Path(tmpdir) / "override")
+            self.assertEqual(resolve_preview_cache_dir(model_dir), Path(tmpdir) / "override")
+
+
+if __name__ == "__main__":
+    unittest.main()
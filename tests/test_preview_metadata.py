@@ -1,6 +1,7 @@
 import os
 import tempfile
 import unittest
+from unittest import mock
 
 try:
     from PySide6 import QtCore, QtGui, QtWidgets
@@ -92,6 +93,169 @@ class TestPreviewAndMetadata(unittest.TestCase):
             self.assertEqual(window.metadata_value_labels["Format"].text(), "PNG")
             self.assertEqual(window.metadata_value_labels["Dimensions"].text(), "10 x 6 px")
 
+    def test_preview_selection_constructs_single_image_reader(self) -> None:
+        from app.ui import MainWindow
+
+        window = MainWindow()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            image_path = os.path.join(tmpdir, "single_reader.png")
+            image = QtGui.QImage(12, 8, QtGui.QImage.Format.Format_ARGB32)
+            image.fill(QtGui.QColor("#00ff00"))
+            self.assertTrue(image.save(image_path))
+
+            window.input_list.add_paths([image_path])
+            window.input_list.clearSelection()
+            with mock.patch(
+                "app.ui.QtGui.QImageReader", wraps=QtGui.QImageReader
+            ) as reader_cls:
+                window._load_preview_and_metadata(image_path)
+
+            self.assertEqual(reader_cls.call_count, 1)
+            self.assertEqual(window.metadata_value_labels["Format"].text(), "PNG")
+            self.assertEqual(window.metadata_value_labels["Dimensions"].text(), "12 x 8 px")
+
+    def test_large_preview_is_downscaled_and_cached(self) -> None:
+        from app.preview_cache import PREVIEW_CACHE_ENV
+        from app.ui import MainWindow
+
+        window = MainWindow()
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch.dict(
+            os.environ, {PREVIEW_CACHE_ENV: os.path.join(tmpdir, "thumbs")}
+        ):
+            image_path = os.path.join(tmpdir, "large.png")
+            image = QtGui.QImage(4096, 1024, QtGui.QImage.Format.Format_RGB32)
+            image.fill(QtGui.QColor("#00ff00"))
+            self.assertTrue(image.save(image_path))
+
+            preview, probe = window._read_image_with_probe(image_path)
+            QtCore.QThreadPool.globalInstance().waitForDone()
+
+            self.assertEqual(preview.size(), QtCore.QSize(2048, 512))
+            self.assertEqual(probe.size, QtCore.QSize(4096, 1024))
+            thumbnail_path = window._current_preview_cache().thumbnail_path(image_path)
+            self.assertTrue(thumbnail_path.exists())
+
+            marker = QtGui.QImage(16, 4, QtGui.QImage.Format.Format_RGB32)
+            marker.fill(QtGui.QColor("#ff0000"))
+            self.assertTrue(marker.save(str(thumbnail_path), "PNG"))
+            cached, _ = window._read_image_with_probe(image_path)
+
+            self.assertEqual(cached.size(), QtCore.QSize(16, 4))
+
+    def test_thumbnail_writes_use_unique_temp_files(self) -> None:
+        from pathlib import Path
+
+        from app.ui import PreviewThumbnailTask
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target = Path(tmpdir) / "thumbs" / "digest.png"
+            image = QtGui.QImage(8, 4, QtGui.QImage.Format.Format_RGB32)
+            image.fill(QtGui.QColor("#00ff00"))
+            temp_names: list[str] = []
+            real_save = QtGui.QImage.save
+
+            def record_save(self_image, name, *args):
+                temp_names.append(name)
+                return real_save(self_image, name, *args)
+
+            with mock.patch.object(QtGui.QImage, "save", record_save):
+                PreviewThumbnailTask(image, target).run()
+                PreviewThumbnailTask(image, target).run()
+
+            self.assertEqual(len(set(temp_names)), 2)
+            self.assertNotIn(str(target.with_suffix(".tmp")), temp_names)
+            self.assertEqual(QtGui.QImage(str(target)).size(), QtCore.QSize(8, 4))
+            self.assertEqual(os.listdir(target.parent), ["digest.png"])
+
+            with mock.patch.object(QtGui.QImage, "save", return_value=False):
+                PreviewThumbnailTask(image, target.with_name("failed.png")).run()
+            with mock.patch("app.ui.os.replace", side_effect=OSError("busy")):
+                PreviewThumbnailTask(image, target.with_name("locked.png")).run()
+
+            self.assertEqual(os.listdir(target.parent), ["digest.png"])
+
+    def test_metadata_without_preview_uses_header_fast_path(self) -> None:
+        from app.ui import MainWindow
+
+        window = MainWindow()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            image_path = os.path.join(tmpdir, "header_fast_path.png")
+            image = QtGui.QImage(7, 5, QtGui.QImage.Format.Format_ARGB32)
+            image.fill(QtGui.QColor("#0000ff"))
+            self.assertTrue(image.save(image_path))
+
+            with mock.patch("app.ui.QtGui.QImageReader") as reader_cls:
+                metadata = window._build_metadata(image_path)
+
+            reader_cls.assert_not_called()
+            self.assertEqual(metadata["Format"], "PNG")
+            self.assertEqual(metadata["Dimensions"], "7 x 5 px")
+
+    def test_metadata_path_uses_forward_slashes(self) -> None:
+        from app.ui import MainWindow
+
+        window = MainWindow()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            image_path = os.path.join(tmpdir, "path_field.png")
+            image = QtGui.QImage(4, 4, QtGui.QImage.Format.Format_ARGB32)
+            image.fill(QtGui.QColor("#ff00ff"))
+            self.assertTrue(image.save(image_path))
+
+            metadata = window._build_metadata(image_path)
+            self.assertEqual(
+                metadata["Path"],
+                QtCore.QFileInfo(image_path).absoluteFilePath(),
+            )
+
+            with mock.patch("app.ui.os.sep", "\\"), mock.patch(
+                "app.ui.os.path.abspath", return_value="C:\\data\\scene.tif"
+            ):
+                metadata = window._build_metadata(image_path)
+
+        self.assertEqual(metadata["Path"], "C:/data/scene.tif")
+
+    def test_unchanged_selection_skips_reload(self) -> None:
+        from app.ui import MainWindow
+
+        window = MainWindow()
+        window.input_list.add_paths(["/tmp/first.tif", "/tmp/second.tif"])
+        with mock.patch.object(window, "_load_preview_and_metadata") as load:
+            self._select_input_path(window, "/tmp/first.tif")
+            window._handle_selection_change()
+            window._handle_selection_change()
+            self._select_input_path(window, "/tmp/second.tif")
+
+        self.assertEqual(
+            [call.args[0] for call in load.call_args_list],
+            ["/tmp/first.tif", "/tmp/second.tif"],
+        )
+
+    def test_path_exists_checks_are_cached_briefly(self) -> None:
+        from app.ui import MainWindow
+
+        window = MainWindow()
+        with mock.patch("app.ui.os.path.exists", return_value=True) as exists:
+            self.assertTrue(window._path_exists("/tmp/cached.tif"))
+            self.assertTrue(window._path_exists("/tmp/cached.tif"))
+            self.assertEqual(exists.call_count, 1)
+
+            window.input_list.add_paths(["/tmp/cached.tif"])
+            window._path_exists("/tmp/cached.tif")
+
+        self.assertEqual(exists.call_count, 2)
+
+    def test_file_size_formatting_unit_boundaries(self) -> None:
+        from app.ui import _format_bytes
+
+        self.assertEqual(_format_bytes(-1), "Unknown")
+        self.assertEqual(_format_bytes(0), "0 B")
+        self.assertEqual(_format_bytes(1023), "1023 B")
+        self.assertEqual(_format_bytes(1024), "1.0 KB")
+        self.assertEqual(_format_bytes(1536), "1.5 KB")
+        self.assertEqual(_format_bytes(1024**2 - 1), "1024.0 KB")
+        self.assertEqual(_format_bytes(5 * 1024**3), "5.0 GB")
+        self.assertEqual(_format_bytes(2048 * 1024**4), "2048.0 TB")
+
     def _select_input_path(self, window: "QtWidgets.QMainWindow", path: str) -> None:
         window.input_list.clearSelection()
         for index in range(window.input_list.count()):
@@ -0,0 +1,180 @@
+import os
+import unittest
+from unittest import mock
+
+
+try:
+    from PySide6 import QtCore, QtGui, QtWidgets
+
+    PYSIDE_AVAILABLE = True
+except ImportError:
+    PYSIDE_AVAILABLE = False
+
+
+@unittest.skipUnless(PYSIDE_AVAILABLE, "PySide6 is required for preview viewer tests")
+class TestPreviewViewerScaling(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        cls.app = QtWidgets.QApplication.instance()
+        if cls.app is None:
+            cls.app = QtWidgets.QApplication([])
+
+    def _image(self, width: int, height: int) -> "QtGui.QImage":
+        image = QtGui.QImage(width, height, QtGui.QImage.Format.Format_RGB32)
+        image.fill(QtGui.QColor("#336699"))
+        return image
+
+    def test_resize_burst_rescales_once_settled(self) -> None:
+        from app.ui import PreviewViewer
+
+        viewer = PreviewViewer()
+        viewer.resize(400, 300)
+        viewer.show()
+        QtWidgets.QApplication.processEvents()
+        viewer.set_image(self._image(200, 100))
+        self.assertEqual(viewer.pixmap().size(), QtCore.QSize(400, 200))
+
+        for width in (380, 360, 340, 320):
+            viewer.resize(width, 300)
+        QtWidgets.QApplication.processEvents()
+
+        self.assertEqual(viewer.pixmap().size(), QtCore.QSize(320, 160))
+
+    def test_live_resize_uses_fast_scaling_until_settled(self) -> None:
+        from app.ui import PreviewViewer
+
+        viewer = PreviewViewer()
+        viewer.resize(400, 300)
+        viewer.show()
+        QtWidgets.QApplication.processEvents()
+        viewer.set_image(self._image(200, 100))
+
+        viewer.resize(300, 300)
+        QtWidgets.QApplication.processEvents()
+        self.assertEqual(viewer._scaled_mode, QtCore.Qt.TransformationMode.FastTransformation)
+
+        viewer._settle_timer.timeout.emit()
+        self.assertEqual(viewer._scaled_mode, QtCore.Qt.TransformationMode.SmoothTransformation)
+        self.assertEqual(viewer.pixmap().size(), QtCore.QSize(300, 150))
+
+    def test_viewers_share_cached_scaled_pixmap(self) -> None:
+        from app.ui import PreviewViewer
+
+        pixmap = QtGui.QPixmap.fromImage(self._image(200, 100))
+        first = PreviewViewer()
+        second = PreviewViewer()
+        for viewer in (first, second):
+            viewer.resize(400, 300)
+            viewer.set_pixmap(pixmap)
+
+        self.assertEqual(first.pixmap().cacheKey(), second.pixmap().cacheKey())
+
+    def test_placeholder_clears_scaled_pixmap(self) -> None:
+        from app.ui import PreviewViewer
+
+        viewer = PreviewViewer()
+        viewer.resize(400, 300)
+        viewer.set_image(self._image(40, 20))
+        viewer.set_placeholder("Nothing selected")
+
+        self.assertTrue(viewer.pixmap().isNull())
+        self.assertEqual(viewer.text(), "Nothing selected")
+
+    def test_repeated_placeholder_is_a_no_op(self) -> None:
+        from app.ui import PreviewViewer
+
+        viewer = PreviewViewer()
+        with mock.patch.object(viewer, "setText", wraps=viewer.setText) as set_text:
+            viewer.set_placeholder("Preview will appear here")
+            viewer.set_placeholder("Select a second model to compare.")
+
+        self.assertEqual(set_text.call_count, 1)
+        self.assertEqual(viewer.text(), "Select a second model to compare.")
+
+
+@unittest.skipUnless(PYSIDE_AVAILABLE, "PySide6 is required for preview viewer tests")
+class TestSwipeComparisonViewScaling(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        cls.app = QtWidgets.QApplication.instance()
+        if cls.app is None:
+            cls.app = QtWidgets.QApplication([])
+
+    def _image(self, width: int, height: int, color: str) -> "QtGui.QImage":
+        image = QtGui.QImage(width, height, QtGui.QImage.Format.Format_RGB32)
+        image.fill(QtGui.QColor(color))
+        return image
+
+    def test_repaints_reuse_prescaled_pixmaps(self) -> None:
+        from app.ui import SwipeComparisonView
+
+        view = SwipeComparisonView()
+        view.resize(400, 300)
+        view.set_before_image(self._image(200, 100, "#000000"))
+        view.set_after_image(self._image(400, 200, "#ffffff"))
+
+        view.grab()
+        scaled_before = view._scaled_before
+        self.assertEqual(scaled_before.size(), QtCore.QSize(400, 200))
+        self.assertEqual(view._scaled_after.size(), QtCore.QSize(400, 200))
+
+        view.set_slider_ratio(0.25)
+        rendered = view.grab().toImage()
+        self.assertIs(view._scaled_before, scaled_before)
+        self.assertEqual(rendered.pixelColor(50, 150), QtGui.QColor("#ffffff"))
+        self.assertEqual(rendered.pixelColor(300, 150), QtGui.QColor("#000000"))
+
+    def test_new_image_invalidates_prescaled_pixmaps(self) -> None:
+        from app.ui import SwipeComparisonView
+
+        view = SwipeComparisonView()
+        view.resize(400, 300)
+        view.set_before_image(self._image(200, 100, "#000000"))
+        view.grab()
+        view.set_before_image(self._image(100, 100, "#000000"))
+        view.grab()
+
+        self.assertEqual(view._scaled_before.size(), QtCore.QSize(300, 300))
+
+    def test_slider_drag_applies_latest_ratio_once_per_frame(self) -> None:
+        from app.ui import SwipeComparisonWidget
+
+        widget = SwipeComparisonWidget()
+        with mock.patch.object(
+            widget.view, "set_slider_ratio", wraps=widget.view.set_slider_ratio
+        ) as set_ratio:
+            for value in (10, 20, 30):
+                widget.slider.setValue(value)
+            set_ratio.assert_not_called()
+
+            widget._slider_timer.timeout.emit()
+
+        set_ratio.assert_called_once_with(0.3)
+
+
+@unittest.skipUnless(PYSIDE_AVAILABLE, "PySide6 is required for preview viewer tests")
+class TestComparisonViewerPixmaps(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        cls.app = QtWidgets.QApplication.instance()
+        if cls.app is None:
+            cls.app = QtWidgets.QApplication([])
+
+    def test_before_image_converted_once_for_both_tabs(self) -> None:
+        from app.ui import ComparisonViewer
+
+        viewer = ComparisonViewer()
+        image = QtGui.QImage(40, 20, QtGui.QImage.Format.Format_RGB32)
+        image.fill(QtGui.QColor("#336699"))
+        viewer.set_before_image(image)
+
+        side_source = viewer.side_by_side.before_viewer._source_pixmap
+        swipe_source = viewer.swipe.view._before_pixmap
+        self.assertEqual(side_source.cacheKey(), swipe_source.cacheKey())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,8 @@ import json
 import os
 import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 
 
 try:
@@ -49,13 +51,43 @@ class TestSessionRecovery(unittest.TestCase):
 
             window = MainWindow()
             self.addCleanup(window.close)
+            self.assertEqual(window.input_list.count(), 1)
+            restored: list[bool] = []
+            window.session_restored.connect(lambda: restored.append(True))
+            QtWidgets.QApplication.processEvents()
 
+            self.assertEqual(restored, [True])
             self.assertEqual(window.input_list.count(), 2)
             self.assertEqual(window.input_list.item(0).text(), "/tmp/input_a.tif")
             self.assertEqual(window.input_list.item(1).text(), "/tmp/input_b.tif")
             selected = [item.text() for item in window.input_list.selectedItems()]
             self.assertEqual(selected, ["/tmp/input_b.tif"])
 
+    def test_restored_selection_emits_one_change(self) -> None:
+        from app.ui import MainWindow
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            session_path = os.path.join(tmpdir, "session.json")
+            self._set_session_env(session_path)
+            paths = [f"/tmp/input_{index}.tif" for index in range(5)]
+            payload = {"dirty": True, "paths": paths, "selected_paths": paths[1:4]}
+            with open(session_path, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle)
+
+            window = MainWindow()
+            self.addCleanup(window.close)
+            QtWidgets.QApplication.processEvents()
+            selected = [item.text() for item in window.input_list.selectedItems()]
+            self.assertEqual(sorted(selected), paths[1:4])
+
+            changes: list[bool] = []
+            window.input_list.itemSelectionChanged.connect(lambda: changes.append(True))
+            window._select_session_paths(paths[:2])
+
+            self.assertEqual(changes, [True])
+            selected = [item.text() for item in window.input_list.selectedItems()]
+            self.assertEqual(sorted(selected), paths[:2])
+
     def test_ignores_clean_previous_session(self) -> None:
         from app.ui import MainWindow
 
@@ -72,6 +104,7 @@ class TestSessionRecovery(unittest.TestCase):
 
             window = MainWindow()
             self.addCleanup(window.close)
+            QtWidgets.QApplication.processEvents()
 
             self.assertEqual(window.input_list.count(), 1)
             self.assertEqual(window.input_list.item(0).text(), window.input_list.placeholder_text)
@@ -85,12 +118,13 @@ class TestSessionRecovery(unittest.TestCase):
 
             window = MainWindow()
             self.addCleanup(window.close)
+            QtWidgets.QApplication.processEvents()
 
             if os.path.exists(session_path):
                 os.remove(session_path)
 
             window.input_list.clear()
-            window.input_list.addItem("/tmp/autosave_input.tif")
+            window.input_list.add_paths(["/tmp/autosave_input.tif"])
             cache_dir = os.path.join(tmpdir, "models")
             window.model_manager_panel.set_model_cache_dir(cache_dir)
             window._autosave_session_state()
@@ -102,6 +136,101 @@ class TestSessionRecovery(unittest.TestCase):
             self.assertEqual(payload["model_cache_dir"], cache_dir)
             self.assertTrue(payload["dirty"])
 
+    def test_autosave_waits_for_idle_after_changes(self) -> None:
+        from app.ui import MainWindow
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            session_path = os.path.join(tmpdir, "session.json")
+            self._set_session_env(session_path)
+
+            window = MainWindow()
+            self.addCleanup(window.close)
+            QtWidgets.QApplication.processEvents()
+            self.assertFalse(window._autosave_timer.isActive())
+
+            window.export_presets_panel.output_format_combo.setCurrentText("PNG")
+            window.advanced_options_panel.scale_combo.setCurrentText("8x")
+            self.assertTrue(window._autosave_timer.isActive())
+            self.assertTrue(window._autosave_timer.isSingleShot())
+
+            window._autosave_timer.timeout.emit()
+            with open(session_path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+
+            self.assertEqual(payload["output_format"], "PNG")
+            self.assertEqual(payload["advanced_scale"], "8x")
+
+    def test_autosave_skips_when_nothing_changed(self) -> None:
+        from app.ui import MainWindow
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            session_path = os.path.join(tmpdir, "session.json")
+            self._set_session_env(session_path)
+
+            window = MainWindow()
+            self.addCleanup(window.close)
+            QtWidgets.QApplication.processEvents()
+
+            with mock.patch.object(window._session_store, "save") as save:
+                window._autosave_session_state()
+                save.assert_not_called()
+
+                window.advanced_options_panel.tiling_combo.setCurrentText("1024 px")
+                window._autosave_session_state()
+                window._autosave_session_state()
+
+            save.assert_called_once()
+
+    def test_selection_changes_coalesce_into_one_save(self) -> None:
+        from app.ui import MainWindow
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            session_path = os.path.join(tmpdir, "session.json")
+            self._set_session_env(session_path)
+
+            window = MainWindow()
+            self.addCleanup(window.close)
+            QtWidgets.QApplication.processEvents()
+            window.input_list.add_paths(["/tmp/input_a.tif", "/tmp/input_b.tif"])
+
+            with mock.patch.object(window._session_store, "save") as save:
+                for row in (0, 1, 0, 1):
+                    window.input_list.setCurrentRow(row)
+                save.assert_not_called()
+                self.assertTrue(window._persist_debounce.isActive())
+
+                window._persist_debounce.timeout.emit()
+                save.assert_not_called()
+
+                window._autosave_timer.timeout.emit()
+
+            save.assert_called_once()
+            self.assertEqual(save.call_args.args[0].selected_paths, ["/tmp/input_b.tif"])
+
+    def test_close_flushes_pending_session_save(self) -> None:
+        from app.ui import MainWindow
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            session_path = os.path.join(tmpdir, "session.json")
+            self._set_session_env(session_path)
+
+            window = MainWindow()
+            QtWidgets.QApplication.processEvents()
+            window.input_list.add_paths(["/tmp/input_a.tif"])
+            self.assertTrue(window._persist_debounce.isActive())
+            store = window._session_store
+            with mock.patch.object(store, "flush", wraps=store.flush) as flush:
+                window.close()
+
+            flush.assert_called_once_with()
+
+            self.assertFalse(window._persist_debounce.isActive())
+            with open(session_path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+
+            self.assertEqual(payload["paths"], ["/tmp/input_a.tif"])
+            self.assertFalse(payload["dirty"])
+
     def test_restores_preferences_from_dirty_session(self) -> None:
         from app.ui import MainWindow
 
@@ -133,6 +262,7 @@ class TestSessionRecovery(unittest.TestCase):
 
             window = MainWindow()
             self.addCleanup(window.close)
+            QtWidgets.QApplication.processEvents()
 
             preset_item = window.export_presets_panel.preset_list.currentItem()
             self.assertIsNotNone(preset_item)
@@ -168,5 +298,25 @@ class TestSessionRecovery(unittest.TestCase):
             self.assertTrue(advanced_panel.completion_notification_check.isChecked())
 
 
+class TestSessionStoreBuffering(unittest.TestCase):
+    def test_save_async_writes_on_flush(self) -> None:
+        from app.session import SessionState, SessionStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            session_path = os.path.join(tmpdir, "session.json")
+            store = SessionStore(Path(session_path))
+            store.save_async(SessionState(paths=["/tmp/a.tif"]))
+            store.save_async(SessionState(paths=["/tmp/b.tif"]))
+            self.assertFalse(os.path.exists(session_path))
+            self.assertEqual(store.load().paths, ["/tmp/b.tif"])
+
+            store.flush()
+            self.assertEqual(store.load().paths, ["/tmp/b.tif"])
+
+            with mock.patch.object(store, "save") as save:
+                store.flush()
+            save.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
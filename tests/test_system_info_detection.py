@@ -0,0 +1,239 @@
+import importlib.util
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+
+try:
+    from PySide6 import QtCore, QtWidgets
+
+    PYSIDE_AVAILABLE = True
+except ImportError:
+    PYSIDE_AVAILABLE = False
+
+ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
+
+
+@unittest.skipUnless(PYSIDE_AVAILABLE, "PySide6 is required for system info tests")
+class TestNvidiaProbe(unittest.TestCase):
+    def setUp(self) -> None:
+        from app import ui
+
+        ui._invalidate_hardware_cache()
+        self.addCleanup(ui._invalidate_hardware_cache)
+        modules_patch = mock.patch.dict(sys.modules, {"pynvml": None})
+        modules_patch.start()
+        self.addCleanup(modules_patch.stop)
+        cdll_patch = mock.patch("app.ui.ctypes.CDLL", side_effect=OSError("libcuda missing"))
+        self.cdll = cdll_patch.start()
+        self.addCleanup(cdll_patch.stop)
+        env_patch = mock.patch.dict(os.environ)
+        env_patch.start()
+        self.addCleanup(env_patch.stop)
+        os.environ.pop("CUDA_VERSION", None)
+
+    def test_gpu_and_cuda_share_one_cached_probe(self) -> None:
+        from app import ui
+
+        outputs = [
+            subprocess.CompletedProcess([], 0, stdout="NVIDIA RTX A4000\n", stderr=""),
+            subprocess.CompletedProcess(
+                [], 0, stdout="| Driver Version: 550.54  CUDA Version: 12.4 |\n", stderr=""
+            ),
+        ]
+        with mock.patch("app.ui.shutil.which", return_value="/usr/bin/nvidia-smi"), mock.patch(
+            "app.ui.subprocess.run", side_effect=outputs
+        ) as run:
+            self.assertEqual(ui._detect_gpu_info(), "NVIDIA RTX A4000")
+            self.assertEqual(ui._detect_cuda_version(), "12.4")
+            self.assertEqual(ui._detect_gpu_info(), "NVIDIA RTX A4000")
+            self.assertEqual(ui._detect_cuda_version(), "12.4")
+
+        self.assertEqual(run.call_count, 2)
+        for call in run.call_args_list:
+            self.assertIn("timeout", call.kwargs)
+            self.assertIs(call.kwargs["stdin"], subprocess.DEVNULL)
+
+    def test_probe_timeout_reports_not_detected(self) -> None:
+        from app import ui
+
+        with mock.patch("app.ui.shutil.which", return_value="/usr/bin/nvidia-smi"), mock.patch(
+            "app.ui.subprocess.run",
+            side_effect=subprocess.TimeoutExpired(["nvidia-smi"], 2.0),
+        ):
+            self.assertEqual(ui._detect_gpu_info(), "Not detected")
+            self.assertEqual(ui._detect_cuda_version(), "Not detected")
+
+    def test_cuda_version_from_driver_library_skips_nvidia_smi(self) -> None:
+        from app import ui
+
+        self.cdll.side_effect = None
+        library = self.cdll.return_value
+
+        def fake_get_version(version_ref):
+            version_ref._obj.value = 12040
+            return 0
+
+        library.cuDriverGetVersion.side_effect = fake_get_version
+        with mock.patch("app.ui.subprocess.run") as run:
+            self.assertEqual(ui._detect_cuda_version(), "12.4")
+        run.assert_not_called()
+
+    def test_nvml_probe_skips_nvidia_smi(self) -> None:
+        from app import ui
+
+        pynvml = mock.Mock(NVMLError=type("NVMLError", (Exception,), {}))
+        pynvml.nvmlDeviceGetCount.return_value = 2
+        pynvml.nvmlDeviceGetName.side_effect = [b"NVIDIA RTX A4000", "NVIDIA T4"]
+        pynvml.nvmlSystemGetCudaDriverVersion_v2.return_value = 12040
+        sys.modules["pynvml"] = pynvml
+        with mock.patch("app.ui.subprocess.run") as run:
+            self.assertEqual(ui._detect_gpu_info(), "NVIDIA RTX A4000, NVIDIA T4")
+            self.assertEqual(ui._detect_cuda_version(), "12.4")
+
+        run.assert_not_called()
+        pynvml.nvmlInit.assert_called_once_with()
+        pynvml.nvmlShutdown.assert_called_once_with()
+
+    def test_invalidate_hardware_cache_forces_rescan(self) -> None:
+        from app import ui
+
+        with mock.patch("app.ui.shutil.which", return_value=None) as which:
+            ui._detect_gpu_info()
+            ui._detect_gpu_info()
+            ui._invalidate_hardware_cache()
+            ui._detect_gpu_info()
+
+        self.assertEqual(which.call_count, 2)
+
+    def test_cuda_env_override_skips_probe(self) -> None:
+        from app import ui
+
+        os.environ["CUDA_VERSION"] = "11.8"
+        with mock.patch("app.ui.subprocess.run") as run:
+            self.assertEqual(ui._detect_cuda_version(), "11.8")
+        run.assert_not_called()
+
+
+@unittest.skipUnless(PYSIDE_AVAILABLE, "PySide6 is required for system info tests")
+class TestModelRegistryCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        cls.app = QtWidgets.QApplication.instance()
+        if cls.app is None:
+            cls.app = QtWidgets.QApplication([])
+
+    def setUp(self) -> None:
+        from app import ui
+
+        ui._REGISTRY_CACHE.clear()
+        self.addCleanup(ui._REGISTRY_CACHE.clear)
+
+    def test_unchanged_registry_is_parsed_once(self) -> None:
+        from app import ui
+
+        with mock.patch.dict(sys.modules, {"orjson": None}), mock.patch(
+            "app.ui.json.loads", wraps=ui.json.loads
+        ) as loads:
+            first = ui._load_model_registry()
+            second = ui._load_model_registry()
+
+        self.assertEqual(loads.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+    @unittest.skipUnless(ORJSON_AVAILABLE, "orjson is not installed")
+    def test_registry_prefers_orjson_when_installed(self) -> None:
+        from app import ui
+
+        with mock.patch("app.ui.json.loads") as loads:
+            entries = ui._load_model_registry()
+
+        loads.assert_not_called()
+        self.assertTrue(entries)
+
+    def test_comparison_panel_shares_cached_registry(self) -> None:
+        from app import ui
+
+        expected = [entry["name"] for entry in ui._load_model_registry()]
+        with mock.patch("builtins.open", side_effect=AssertionError("registry re-read")):
+            names = ui.ModelComparisonPanel()._load_model_names()
+
+        self.assertEqual(names, expected)
+
+    def test_entries_carry_parsed_version(self) -> None:
+        from app import ui
+
+        entries = ui._load_model_registry()
+        with mock.patch("app.ui._extract_model_version") as extract:
+            text = ui._format_model_versions(entries)
+
+        extract.assert_not_called()
+        self.assertTrue(all("parsed_version" in entry for entry in entries))
+        self.assertIn("Real-ESRGAN - ", text)
+
+    def test_registry_reloads_when_mtime_changes(self) -> None:
+        from app import ui
+
+        ui._load_model_registry()
+        path, (mtime_ns, entries) = next(iter(ui._REGISTRY_CACHE.items()))
+        ui._REGISTRY_CACHE[path] = (mtime_ns - 1, [])
+
+        self.assertEqual(ui._load_model_registry(), entries)
+
+    def test_app_version_reloads_when_mtime_changes(self) -> None:
+        from app import ui
+
+        ui._APP_VERSION_CACHE.clear()
+        self.addCleanup(ui._APP_VERSION_CACHE.clear)
+        version = ui._read_app_version()
+        with mock.patch("builtins.open", side_effect=AssertionError("pyproject re-read")):
+            self.assertEqual(ui._read_app_version(), version)
+
+        path, (mtime_ns, _) = next(iter(ui._APP_VERSION_CACHE.items()))
+        ui._APP_VERSION_CACHE[path] = (mtime_ns - 1, "0.0.0-stale")
+        self.assertEqual(ui._read_app_version(), version)
+
+
+@unittest.skipUnless(PYSIDE_AVAILABLE, "PySide6 is required for system info tests")
+class TestSystemInfoPanelDetection(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        cls.app = QtWidgets.QApplication.instance()
+        if cls.app is None:
+            cls.app = QtWidgets.QApplication([])
+
+    def test_labels_update_after_background_probe(self) -> None:
+        from app.ui import SystemInfoPanel
+
+        with mock.patch("app.ui._detect_gpu_info", return_value="Test GPU"), mock.patch(
+            "app.ui._detect_cuda_version", return_value="12.1"
+        ), mock.patch("app.ui._format_model_versions", return_value="Test model - v1"):
+            panel = SystemInfoPanel()
+            self.assertEqual(panel.gpu_value.text(), "Not yet detected")
+            panel.show()
+            self.assertEqual(panel.gpu_value.text(), "Detecting...")
+            self.assertEqual(panel.model_versions_value.text(), "Detecting...")
+            QtCore.QThreadPool.globalInstance().waitForDone()
+            QtWidgets.QApplication.processEvents()
+
+        self.assertEqual(panel.gpu_value.text(), "Test GPU")
+        self.assertEqual(panel.cuda_value.text(), "12.1")
+        self.assertEqual(panel.model_versions_value.text(), "Test model - v1")
+
+    def test_hidden_panel_skips_probe(self) -> None:
+        from app.ui import SystemInfoPanel
+
+        with mock.patch("app.ui.SystemInfoProbeTask") as task_cls:
+            panel = SystemInfoPanel()
+            task_cls.assert_not_called()
+
+        self.assertEqual(panel.cuda_value.text(), "Not yet detected")
+
+
+if __name__ == "__main__":
+    unittest.main()
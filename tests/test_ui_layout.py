@@ -66,6 +66,14 @@ class TestPrimaryLayout(unittest.TestCase):
             ],
         )
         self.assertEqual(len(window.workflow_stage_actions), 6)
+        self.assertEqual(window.workflow_stage_labels[2].objectName(), "workflowStageLabel3")
+        self.assertEqual(window.workflow_stage_actions[2].objectName(), "workflowStageAction3")
+        self.assertIsNotNone(window.findChild(QtWidgets.QLabel, "metadataValueSceneID"))
+        run_index = window.workflow_stage_names.index("Run")
+        self.assertIs(window.run_button, window.workflow_stage_actions[run_index])
+        for stage_name, attr in MainWindow._STAGE_HANDLER_ATTRS.items():
+            self.assertIn(stage_name, window.workflow_stage_names)
+            self.assertTrue(callable(getattr(window, attr)))
 
     def test_primary_action_shortcuts(self) -> None:
         from app.ui import MainWindow
@@ -78,12 +86,24 @@ class TestPrimaryLayout(unittest.TestCase):
             ["Ctrl+1", "Ctrl+2", "Ctrl+3", "Ctrl+4", "Ctrl+5", "Ctrl+6"],
         )
 
+    def test_shortcut_sequences_are_parsed_once(self) -> None:
+        from app.ui import MainWindow, _shortcut
+
+        MainWindow()
+        with mock.patch("app.ui.QtGui.QKeySequence") as key_sequence:
+            window = MainWindow()
+
+        key_sequence.assert_not_called()
+        self.assertIs(_shortcut("Ctrl+1"), _shortcut("Ctrl+1"))
+        self.assertEqual(window.workflow_stage_actions[0].shortcut().toString(), "Ctrl+1")
+
     def test_model_manager_panel(self) -> None:
         from app.model_installation import resolve_model_cache_dir
         from app.ui import MainWindow, ModelManagerPanel
 
         window = MainWindow()
         panel = window.model_manager_panel
+        QtWidgets.QApplication.processEvents()
         self.assertIsInstance(panel, ModelManagerPanel)
         self.assertEqual(panel.objectName(), "modelManagerPanel")
         self.assertEqual(panel.cache_dir_input.objectName(), "modelCacheDirInput")
@@ -115,11 +135,65 @@ class TestPrimaryLayout(unittest.TestCase):
         self.assertIsNotNone(status_item)
         self.assertEqual(status_item.text(), "Installed")
 
+    def test_model_manager_defers_registry_load(self) -> None:
+        from app.ui import ModelManagerPanel
+
+        panel = ModelManagerPanel()
+        self.assertEqual(panel.model_table.rowCount(), 0)
+        self.assertEqual(panel.models, [])
+
+        QtWidgets.QApplication.processEvents()
+        self.assertGreater(panel.model_table.rowCount(), 0)
+        self.assertEqual(len(panel.models), panel.model_table.rowCount())
+
+    def test_model_manager_cache_dir_change_keeps_table_items(self) -> None:
+        from app.ui import ModelManagerPanel
+
+        panel = ModelManagerPanel()
+        QtWidgets.QApplication.processEvents()
+        items = [panel.model_table.item(row, 2) for row in range(panel.model_table.rowCount())]
+
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch.object(
+            panel.model_table, "setItem"
+        ) as set_item:
+            panel.set_model_cache_dir(tmpdir)
+
+        set_item.assert_not_called()
+        self.assertEqual(
+            [panel.model_table.item(row, 2) for row in range(panel.model_table.rowCount())],
+            items,
+        )
+        self.assertTrue(panel.model_table.updatesEnabled())
+
+    def test_model_manager_reuses_version_combo_items(self) -> None:
+        from app.ui import ModelManagerPanel
+
+        panel = ModelManagerPanel()
+        QtWidgets.QApplication.processEvents()
+        rows_by_versions: dict[tuple[str, ...], list[int]] = {}
+        for row, model in enumerate(panel.models):
+            rows_by_versions.setdefault(model.versions, []).append(row)
+        rows = max(rows_by_versions.values(), key=len)
+        self.assertGreater(len(rows), 1)
+
+        panel.model_table.selectRow(rows[0])
+        with mock.patch.object(
+            panel.version_combo, "clear", wraps=panel.version_combo.clear
+        ) as clear:
+            panel.model_table.selectRow(rows[1])
+
+        clear.assert_not_called()
+        self.assertEqual(
+            [panel.version_combo.itemText(i) for i in range(panel.version_combo.count())],
+            list(panel.models[rows[1]].versions),
+        )
+
     def test_model_manager_status_transitions(self) -> None:
         from app.ui import MainWindow
 
         window = MainWindow()
         panel = window.model_manager_panel
+        QtWidgets.QApplication.processEvents()
 
         available_row = None
         for row in range(panel.model_table.rowCount()):
@@ -167,6 +241,7 @@ class TestPrimaryLayout(unittest.TestCase):
         try:
             window = MainWindow()
             panel = window.model_manager_panel
+            QtWidgets.QApplication.processEvents()
             panel._STATUS_UPDATE_DELAY_MS = 1
 
             available_row = None
@@ -208,6 +283,7 @@ class TestPrimaryLayout(unittest.TestCase):
 
         window = MainWindow()
         panel = window.model_manager_panel
+        QtWidgets.QApplication.processEvents()
 
         gpl_row = None
         for row in range(panel.model_table.rowCount()):
@@ -229,14 +305,15 @@ class TestPrimaryLayout(unittest.TestCase):
 
         model = panel.models[gpl_row]
         self.assertTrue(prompt.called)
-        self.assertFalse(bool(model.get("updating")))
-        self.assertFalse(bool(model.get("installed")))
+        self.assertFalse(model.updating)
+        self.assertFalse(model.installed)
 
     def test_model_manager_marks_missing_weights_as_unavailable(self) -> None:
         from app.ui import MainWindow
 
         window = MainWindow()
         panel = window.model_manager_panel
+        QtWidgets.QApplication.processEvents()
 
         unavailable_row = None
         for row in range(panel.model_table.rowCount()):
@@ -282,6 +359,26 @@ class TestPrimaryLayout(unittest.TestCase):
             window.comparison_viewer.side_by_side.after_title.text().startswith("Model B")
         )
 
+    def test_model_comparison_texts_follow_selection(self) -> None:
+        from app.ui import ModelComparisonPanel
+
+        panel = ModelComparisonPanel()
+        self.assertEqual(panel.comparison_labels(), ("Before", "After"))
+
+        panel.mode_combo.setCurrentText("Model comparison")
+        with mock.patch.object(
+            panel.mode_combo, "currentText", wraps=panel.mode_combo.currentText
+        ) as current_text:
+            first = panel.placeholder_texts()
+            self.assertEqual(panel.placeholder_texts(), first)
+        self.assertEqual(current_text.call_count, 1)
+        self.assertEqual(first[1], "Select a second model to compare.")
+
+        panel.model_b_combo.setCurrentIndex(1)
+        model_b = panel.model_b_combo.currentText()
+        self.assertEqual(panel.comparison_labels()[1], f"Model B: {model_b}")
+        self.assertEqual(panel.placeholder_texts()[1], "Model output will appear here")
+
     def test_export_presets_panel(self) -> None:
         from app.ui import ExportPresetsPanel, MainWindow
 
@@ -436,6 +533,51 @@ class TestPrimaryLayout(unittest.TestCase):
         self.assertTrue(panel.completion_notification_check.isEnabled())
         self.assertTrue(panel.completion_notification_check.isChecked())
 
+    def test_collapsible_panel_ignores_unchanged_state(self) -> None:
+        from app.ui import CollapsiblePanel
+
+        panel = CollapsiblePanel("Options")
+        with mock.patch.object(
+            panel.toggle_button, "setArrowType", wraps=panel.toggle_button.setArrowType
+        ) as set_arrow:
+            panel._toggle_content(False)
+            panel._toggle_content(True)
+            panel._toggle_content(True)
+
+        self.assertEqual(set_arrow.call_count, 1)
+        self.assertFalse(panel.content_area.isHidden())
+
+    def test_safe_mode_restores_previous_selection(self) -> None:
+        from app.ui import AdvancedOptionsPanel
+
+        panel = AdvancedOptionsPanel()
+        panel.scale_combo.setCurrentText("8x")
+        panel.compute_combo.setCurrentText("GPU")
+        panel.seam_blend_check.setChecked(True)
+
+        panel.safe_mode_check.setChecked(True)
+        panel.safe_mode_check.setChecked(False)
+
+        self.assertEqual(panel.scale_combo.currentText(), "8x")
+        self.assertEqual(panel.compute_combo.currentText(), "GPU")
+        self.assertEqual(panel.tiling_combo.currentText(), "Auto")
+        self.assertTrue(panel.seam_blend_check.isChecked())
+
+    def test_safe_mode_toggle_does_not_emit_control_signals(self) -> None:
+        from app.ui import AdvancedOptionsPanel
+
+        panel = AdvancedOptionsPanel()
+        panel.scale_combo.setCurrentText("8x")
+        emitted: list[str] = []
+        panel.scale_combo.currentTextChanged.connect(emitted.append)
+
+        panel.safe_mode_check.setChecked(True)
+        panel.safe_mode_check.setChecked(False)
+
+        self.assertEqual(emitted, [])
+        self.assertTrue(panel.content_area.updatesEnabled())
+        self.assertFalse(panel.scale_combo.signalsBlocked())
+
     def test_run_settings_capture_compute_override(self) -> None:
         from app.ui import MainWindow
 
@@ -493,6 +635,34 @@ class TestPrimaryLayout(unittest.TestCase):
         self.assertEqual(swipe.slider.maximum(), 100)
         self.assertEqual(swipe.slider.value(), 50)
 
+    def test_comparison_state_skips_unchanged_updates(self) -> None:
+        from app.ui import MainWindow
+
+        window = MainWindow()
+        with mock.patch.object(window.comparison_viewer, "set_titles") as set_titles:
+            window._update_comparison_state()
+            set_titles.assert_not_called()
+
+            window.model_comparison_panel.mode_combo.setCurrentText("Model comparison")
+            window._update_comparison_state()
+
+        set_titles.assert_called_once()
+
+    def test_comparison_state_applies_with_viewer_updates_paused(self) -> None:
+        from app.ui import MainWindow
+
+        window = MainWindow()
+        viewer = window.comparison_viewer
+        with mock.patch.object(
+            viewer, "setUpdatesEnabled", wraps=viewer.setUpdatesEnabled
+        ) as set_updates:
+            window.model_comparison_panel.mode_combo.setCurrentText("Model comparison")
+
+        self.assertEqual(
+            [call.args for call in set_updates.call_args_list], [(False,), (True,)]
+        )
+        self.assertTrue(viewer.updatesEnabled())
+
     def test_swipe_placeholder_clears_before_image(self) -> None:
         from PySide6 import QtGui
 
@@ -522,8 +692,35 @@ class TestPrimaryLayout(unittest.TestCase):
         )
         self.assertTrue(panel.gpu_value.text())
         self.assertTrue(panel.cuda_value.text())
+        window.show()
+        QtCore.QThreadPool.globalInstance().waitForDone()
+        QtWidgets.QApplication.processEvents()
         self.assertIn("Real-ESRGAN", panel.model_versions_value.text())
 
+    def test_changelog_panels_share_entry_data(self) -> None:
+        from app.ui import ChangelogPanel
+
+        first = ChangelogPanel()
+        second = ChangelogPanel()
+        self.assertIs(first._app_entries, second._app_entries)
+        self.assertIs(first._model_entries, second._model_entries)
+
+    def test_changelog_panel_loads_update_preference_when_shown(self) -> None:
+        from app.ui import ChangelogPanel
+
+        with mock.patch("app.ui.UpdatePreferenceStore") as store_cls:
+            store_cls.return_value.load.return_value = mock.Mock(enabled=True)
+            panel = ChangelogPanel()
+            store_cls.return_value.load.assert_not_called()
+
+            panel.show()
+            panel.show()
+
+        store_cls.return_value.load.assert_called_once_with()
+        store_cls.return_value.save.assert_not_called()
+        self.assertTrue(panel.update_checks_enabled.isChecked())
+        self.assertTrue(panel.check_updates_button.isEnabled())
+
     def test_changelog_panel(self) -> None:
         from app.ui import ChangelogPanel, MainWindow
 